@@ -0,0 +1,125 @@
+import os
+import pandas as pd
+from nhl_files import atomic_write
+
+# The columnar store needs a Parquet engine; without one everything stays CSV-only
+try:
+    import pyarrow  # noqa: F401
+    COLUMNAR_ENABLED = True
+except ImportError:
+    try:
+        import fastparquet  # noqa: F401
+        COLUMNAR_ENABLED = True
+    except ImportError:
+        COLUMNAR_ENABLED = False
+
+COLUMNAR_SUFFIX = '.parquet'
+
+# Column types of the gamelogs in the columnar store
+GAMELOG_DTYPES = {
+    'Date': 'datetime64[ns]',
+    'Away Team': 'category', 'Home Team': 'category',
+    'Away Team Goals': 'Int64', 'Home Team Goals': 'Int64',
+    'Away Goalie': 'category', 'Home Goalie': 'category',
+    'Away Goalie TOI': 'Int64', 'Home Goalie TOI': 'Int64',
+    'Away Goalie GA': 'Int64', 'Home Goalie GA': 'Int64',
+    'Away GAA': 'float64', 'Home GAA': 'float64'
+}
+
+# Column types of the team and goalie data; the counts keep the types read_csv infers
+STATS_DTYPES = {'Name': 'category'}
+
+GAMELOG_DATE_FORMAT = '%Y%m%d'
+
+
+def columnar_filename(csv_filename):
+    return os.path.splitext(csv_filename)[0] + COLUMNAR_SUFFIX
+
+
+def is_columnar(filename):
+    return filename.endswith(COLUMNAR_SUFFIX)
+
+
+def columnar_is_current(csv_filename):
+    """Whether the columnar copy of a CSV exists and was written after the CSV last changed."""
+    if not COLUMNAR_ENABLED:
+        return False
+    try:
+        return os.stat(columnar_filename(csv_filename)).st_mtime_ns >= os.stat(csv_filename).st_mtime_ns
+    except OSError:
+        return False
+
+
+def apply_dtypes(data_df, dtypes):
+    """Convert the columns of a table read from CSV to their columnar types."""
+    data_df = data_df.copy()
+    for column, dtype in dtypes.items():
+        if column not in data_df:
+            continue
+        if dtype.startswith('datetime'):
+            data_df[column] = pd.to_datetime(data_df[column].astype(str), format=GAMELOG_DATE_FORMAT)
+        elif dtype == 'Int64':
+            data_df[column] = pd.to_numeric(data_df[column]).astype('Int64')
+        else:
+            data_df[column] = data_df[column].astype(dtype)
+    return data_df
+
+
+# Function to write the columnar copy of a CSV next to it
+def export_columnar(csv_filename, dtypes):
+    """
+    Writes the typed columnar copy of a CSV. The CSV stays the file the scrapers append to and
+    is kept for compatibility; readers use the copy only while it is current.
+
+    Parameters:
+    csv_filename (str): The CSV to copy.
+    dtypes (dict): Column types of the copy, e.g. GAMELOG_DTYPES.
+
+    Returns:
+    str: The columnar filename, or None if no Parquet engine is installed or the CSV could not be typed.
+    """
+    if not COLUMNAR_ENABLED:
+        return None
+
+    try:
+        data_df = apply_dtypes(pd.read_csv(csv_filename), dtypes)
+    except (ValueError, TypeError) as e:
+        print(f"Skipping columnar copy of {csv_filename}: {e}")
+        return None
+
+    filename = columnar_filename(csv_filename)
+    with atomic_write(filename) as tmp_filename:
+        data_df.to_parquet(tmp_filename, index=False)
+    return filename
+
+
+def read_table(csv_filename):
+    """Load a CSV, from its columnar copy when that copy is current."""
+    if columnar_is_current(csv_filename):
+        return pd.read_parquet(columnar_filename(csv_filename))
+    return pd.read_csv(csv_filename)
+
+
+def read_gamelog_rows(filename):
+    """
+    Loads a columnar gamelog as rows holding the same text csv.DictReader reads from the CSV gamelog,
+    so folding either one gives identical counts.
+
+    Parameters:
+    filename (str): The columnar gamelog.
+
+    Returns:
+    list: The gamelog rows as dicts of column to text.
+    """
+    data_df = pd.read_parquet(filename)
+    text_df = pd.DataFrame(index=data_df.index)
+    for column in data_df.columns:
+        values = data_df[column]
+        if pd.api.types.is_datetime64_any_dtype(values):
+            text_df[column] = values.dt.strftime(GAMELOG_DATE_FORMAT)
+        elif pd.api.types.is_float_dtype(values):
+            # ESPN reports GAA with two decimals
+            text_df[column] = values.map(lambda value: '' if pd.isna(value) else f'{value:.2f}')
+        else:
+            text_df[column] = values.astype(object).map(lambda value: '' if pd.isna(value) else str(value))
+    return text_df.to_dict('records')
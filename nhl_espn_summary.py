@@ -0,0 +1,131 @@
+import json
+import re
+import requests
+from nhl_goalie_cache import PLAYER_ID_PATTERN
+from nhl_http import fetch_page
+from nhl_metrics import timed
+
+# ESPN's structured game summary: linescores and player stat lines of a game as JSON.
+# It is a small fraction of the box score page, so the scrapers read it first and keep the HTML page as the fallback.
+SUMMARY_URL = 'https://site.api.espn.com/apis/site/v2/sports/hockey/nhl/summary?event={game_id}'
+SUMMARY_ENABLED = True
+
+GAME_ID_PATTERN = re.compile(r'gameId/(\d+)')
+
+# Goalie pages are always requested by this URL, whichever source linked to them, so the summary and the
+# box score page lead to the same page cache entries, fixtures and gamelog rows
+PLAYER_URL = 'https://www.espn.com/nhl/player/_/id/{player_id}'
+
+# Goalie stat columns read from the summary, by the labels the box score page shows above them
+GOALIE_GA_LABEL = 'GA'
+GOALIE_TOI_LABEL = 'TOI'
+
+# Periods every finished game has in its linescore
+REGULATION_PERIODS = 3
+
+
+def summary_url(box_score_url):
+    """The summary URL of the game behind a box score URL, or None if the URL has no game id."""
+    match = GAME_ID_PATTERN.search(box_score_url)
+    return SUMMARY_URL.format(game_id=match.group(1)) if match else None
+
+
+def linescore_cells(competitor):
+    """
+    A team's linescore laid out like a row of the box score page's linescore table:
+    the team in column 0, then the goals of each period as text.
+    """
+    cells = [competitor['team'].get('abbreviation', '')]
+    for linescore in competitor['linescores']:
+        value = linescore.get('displayValue')
+        cells.append(str(value) if value is not None else str(int(linescore['value'])))
+    return cells
+
+
+def player_url(url):
+    """The canonical PLAYER_URL of the player a link points to, e.g. with the name slug and query dropped."""
+    match = PLAYER_ID_PATTERN.search(url)
+    return PLAYER_URL.format(player_id=match.group(1)) if match else url
+
+
+def goalie_url(athlete):
+    return PLAYER_URL.format(player_id=athlete['id'])
+
+
+def starting_goalie_line(team_players):
+    """
+    The first goalie listed for a team, as the box score page lists the starter first.
+
+    Returns:
+    tuple: (short_name, goalie_url, ga, toi_minutes), all as text but the URL.
+    """
+    for group in team_players['statistics']:
+        labels = group.get('labels', [])
+        if GOALIE_GA_LABEL in labels and GOALIE_TOI_LABEL in labels and group.get('athletes'):
+            line = group['athletes'][0]
+            athlete = line['athlete']
+            name = athlete.get('shortName') or athlete['displayName']
+            ga = line['stats'][labels.index(GOALIE_GA_LABEL)]
+            toi = line['stats'][labels.index(GOALIE_TOI_LABEL)].split(':')[0]
+            float(toi)  # A starter always has a TOI; anything else is not a finished game's line
+            return name.strip(), goalie_url(athlete), ga.strip(), toi.strip()
+    raise ValueError("No goalie stat line in the summary")
+
+
+def parse_summary(summary):
+    """
+    Extracts what the scrapers read from a box score page out of a game summary.
+
+    Parameters:
+    summary (dict): The decoded summary JSON.
+
+    Returns:
+    dict: 'linescores' (away and home rows, laid out like the box score page's linescore table),
+    and the away and home starting goalie's 'name', 'url', 'ga' and 'toi', keyed like 'away_goalie_ga'.
+
+    Raises:
+    KeyError, IndexError, ValueError: If the summary does not hold a finished game's lines.
+    """
+    competitors = summary['header']['competitions'][0]['competitors']
+    teams = {competitor['homeAway']: competitor for competitor in competitors}
+    players = {team_players['team']['id']: team_players for team_players in summary['boxscore']['players']}
+
+    lines = {'linescores': [linescore_cells(teams['away']), linescore_cells(teams['home'])]}
+    if min(len(cells) for cells in lines['linescores']) < 1 + REGULATION_PERIODS:
+        raise ValueError("The summary linescore does not cover regulation")
+    for side in ('away', 'home'):
+        name, url, ga, toi = starting_goalie_line(players[teams[side]['team']['id']])
+        lines[f'{side}_goalie'] = name
+        lines[f'{side}_goalie_url'] = url
+        lines[f'{side}_goalie_ga'] = ga
+        lines[f'{side}_goalie_toi'] = toi
+    return lines
+
+
+# Function to read a box score's lines from the game summary JSON
+def fetch_box_score_lines(box_score_url, headers=None):
+    """
+    Fetches and parses the game summary behind a box score URL.
+
+    Parameters:
+    box_score_url (str): The ESPN box score URL.
+    headers (dict): The HTTP headers to send.
+
+    Returns:
+    dict: The parse_summary lines, or None when the summary is disabled, unavailable or incomplete,
+    in which case the caller scrapes the box score page instead.
+    """
+    url = summary_url(box_score_url)
+    if not SUMMARY_ENABLED or url is None:
+        return None
+
+    try:
+        text = fetch_page(url, 'summary', headers)
+        with timed('parse'):
+            summary = json.loads(text)
+        return parse_summary(summary)
+    except requests.RequestException as e:
+        print(f"Request error for summary URL {url}, falling back to the box score page: {e}")
+    except (KeyError, IndexError, TypeError, ValueError) as e:
+        print(f"Unexpected summary for {url}, falling back to the box score page: {e!r}")
+    return None
@@ -0,0 +1,32 @@
+import os
+import threading
+from contextlib import contextmanager
+
+# File helpers shared by the scrapers, the gamelog readers and the run summaries.
+# Kept free of other nhl_ imports so every module, nhl_metrics included, can use them.
+
+
+# Function to replace a file only once its new contents are completely written
+@contextmanager
+def atomic_write(filename):
+    """
+    Yields a temporary filename to write to, and swaps it in for filename when the block finishes,
+    so a crash never leaves a half-written file and readers see either the old or the new contents.
+    The temporary name is unique per process and thread, so concurrent writers never share one.
+
+    Parameters:
+    filename (str): The file to replace.
+
+    Yields:
+    str: The temporary filename; it is removed instead if the block raises.
+    """
+    tmp_filename = f"{filename}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        yield tmp_filename
+    except BaseException:
+        try:
+            os.remove(tmp_filename)
+        except OSError:
+            pass
+        raise
+    os.replace(tmp_filename, filename)
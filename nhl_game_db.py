@@ -0,0 +1,292 @@
+import csv
+import os
+import sqlite3
+from pathlib import Path
+from nhl_metrics import increment
+
+# SQLite copy of the scraped games, kept next to the gamelog CSVs by the scrapers when GAME_DB_ENABLED.
+# The CSVs stay the primary output: every write records the size and modification time of the CSV it mirrors,
+# and reads use the database only while the CSV still matches them, reading the CSV instead when it does not,
+# e.g. while the database is disabled, after a failed write or after the CSV was written without the database.
+GAME_DB_FILENAME = 'nhl_games.sqlite3'
+GAME_DB_ENABLED = False
+
+# Gamelog CSV column to games table column
+GAME_COLUMNS = {
+    'Date': 'date',
+    'Away Team': 'away_team',
+    'Home Team': 'home_team',
+    'Away Team Goals': 'away_team_goals',
+    'Home Team Goals': 'home_team_goals',
+    'Away Goalie': 'away_goalie',
+    'Home Goalie': 'home_goalie',
+    'Away Goalie TOI': 'away_goalie_toi',
+    'Home Goalie TOI': 'home_goalie_toi',
+    'Away Goalie GA': 'away_goalie_ga',
+    'Home Goalie GA': 'home_goalie_ga',
+    'Away GAA': 'away_gaa',
+    'Home GAA': 'home_gaa'
+}
+
+INTEGER_COLUMNS = {'away_team_goals', 'home_team_goals', 'away_goalie_toi', 'home_goalie_toi', 'away_goalie_ga', 'home_goalie_ga'}
+REAL_COLUMNS = {'away_gaa', 'home_gaa'}
+
+# The gamelogs table holds the high-water mark of each gamelog: the CSV size and modification time its games
+# were stored at, written in the same transaction as the games.
+# Games are keyed per gamelog (e.g. 'nhl_fp_gamelog'), since every period logs the same game.
+# rowid keeps the order games were scraped in, which the L10/L5 windows and streaks depend on.
+SCHEMA = '''
+CREATE TABLE IF NOT EXISTS games (
+    gamelog TEXT NOT NULL,
+    date TEXT NOT NULL,
+    away_team TEXT NOT NULL,
+    home_team TEXT NOT NULL,
+    away_team_goals INTEGER,
+    home_team_goals INTEGER,
+    away_goalie TEXT,
+    home_goalie TEXT,
+    away_goalie_toi INTEGER,
+    home_goalie_toi INTEGER,
+    away_goalie_ga INTEGER,
+    home_goalie_ga INTEGER,
+    away_gaa REAL,
+    home_gaa REAL,
+    PRIMARY KEY (gamelog, date, away_team, home_team)
+);
+CREATE INDEX IF NOT EXISTS games_date ON games (date);
+CREATE INDEX IF NOT EXISTS games_away_team ON games (away_team);
+CREATE INDEX IF NOT EXISTS games_home_team ON games (home_team);
+CREATE INDEX IF NOT EXISTS games_away_goalie ON games (away_goalie);
+CREATE INDEX IF NOT EXISTS games_home_goalie ON games (home_goalie);
+CREATE TABLE IF NOT EXISTS gamelogs (
+    gamelog TEXT PRIMARY KEY,
+    csv_size INTEGER NOT NULL,
+    csv_mtime_ns INTEGER NOT NULL
+);
+'''
+
+
+def gamelog_name(gamelog_filename):
+    """The key of a gamelog's games in the database: its CSV filename without the extension."""
+    return os.path.splitext(os.path.basename(gamelog_filename))[0]
+
+
+def is_game_db(filename):
+    return filename.endswith('.sqlite3')
+
+
+def connect(filename=GAME_DB_FILENAME):
+    connection = sqlite3.connect(filename)
+    connection.executescript(SCHEMA)
+    return connection
+
+
+def connect_read_only(filename):
+    """Opens an existing database for reading, without creating the file or its schema."""
+    return sqlite3.connect(f"{Path(filename).absolute().as_uri()}?mode=ro", uri=True)
+
+
+def to_db_value(column, value):
+    if value is None or value == '':
+        return None
+    try:
+        if column in INTEGER_COLUMNS:
+            return int(float(value))
+        if column in REAL_COLUMNS:
+            return float(value)
+    except ValueError:
+        # Text ESPN shows instead of a number, e.g. '--' for a goalie without a GAA, is stored as it is
+        pass
+    return str(value)
+
+
+def to_csv_value(column, value):
+    # Values come back as the gamelog CSV holds them; ESPN reports GAA with two decimals
+    if value is None:
+        return ''
+    if column in REAL_COLUMNS and not isinstance(value, str):
+        return f'{value:.2f}'
+    return str(value)
+
+
+def insert_games(connection, gamelog_filename, rows):
+    """
+    Inserts gamelog rows into the games table, skipping games already stored; the caller commits.
+
+    Parameters:
+    connection (sqlite3.Connection): The open database.
+    gamelog_filename (str): The gamelog CSV the rows belong to.
+    rows (iterable): Gamelog rows, as written to the CSV.
+    """
+    columns = list(GAME_COLUMNS.values())
+    statement = (
+        f"INSERT OR IGNORE INTO games (gamelog, {', '.join(columns)}) "
+        f"VALUES (?, {', '.join('?' for _ in columns)})"
+    )
+    name = gamelog_name(gamelog_filename)
+    connection.executemany(statement, (
+        [name] + [to_db_value(column, row[field]) for field, column in GAME_COLUMNS.items()]
+        for row in rows
+    ))
+
+
+def delete_games(connection, gamelog_filename, date=None):
+    """Deletes a gamelog's games, or only those of one YYYYMMDD date; the caller commits."""
+    if date is None:
+        connection.execute("DELETE FROM games WHERE gamelog = ?", (gamelog_name(gamelog_filename),))
+    else:
+        connection.execute("DELETE FROM games WHERE gamelog = ? AND date = ?", (gamelog_name(gamelog_filename), date))
+
+
+def csv_version(gamelog_filename):
+    """The (size, modification time) of a gamelog CSV, or None if it does not exist."""
+    try:
+        stat = os.stat(gamelog_filename)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
+
+
+def mark_synced(connection, gamelog_filename, version=None):
+    """
+    Records that the database holds every game of the gamelog CSV as it is now on disk, or as it was at
+    version; called after the CSV is written and before the transaction holding its games is committed,
+    so both land together.
+    """
+    version = version or csv_version(gamelog_filename)
+    if version is not None:
+        connection.execute(
+            "INSERT OR REPLACE INTO gamelogs (gamelog, csv_size, csv_mtime_ns) VALUES (?, ?, ?)",
+            (gamelog_name(gamelog_filename),) + version
+        )
+
+
+def synced_size(connection, gamelog_filename):
+    """The CSV size the database last stored every game of the gamelog at, or None if it never did."""
+    record = connection.execute("SELECT csv_size FROM gamelogs WHERE gamelog = ?", (gamelog_name(gamelog_filename),)).fetchone()
+    return record[0] if record else None
+
+
+def is_synced(connection, gamelog_filename):
+    """Whether the gamelog CSV is still as it was when the database last stored its games."""
+    record = connection.execute(
+        "SELECT csv_size, csv_mtime_ns FROM gamelogs WHERE gamelog = ?", (gamelog_name(gamelog_filename),)
+    ).fetchone()
+    return record is not None and tuple(record) == csv_version(gamelog_filename)
+
+
+def read_csv_rows(gamelog_filename):
+    if not os.path.exists(gamelog_filename):
+        return []
+    with open(gamelog_filename, mode='r', newline='', encoding='utf-8') as file:
+        return [{field: row[field] for field in GAME_COLUMNS} for row in csv.DictReader(file)]
+
+
+def query_games(filename, gamelog_filename, where, parameters, matches):
+    """
+    Runs a query on a gamelog's games through the database when GAME_DB_ENABLED and the database is in sync
+    with the gamelog CSV, and filters the CSV otherwise. Checking the sync is a lookup and a stat, not a CSV read.
+
+    Parameters:
+    filename (str): The SQLite database.
+    gamelog_filename (str): The gamelog CSV whose games are queried.
+    where (str): The WHERE clause of the query, with its parameters as ? placeholders.
+    parameters (tuple): The parameters of the WHERE clause.
+    matches (callable): Takes a CSV row and tells whether the query selects it, used when the
+    database is disabled or out of sync and the CSV is filtered instead.
+
+    Returns:
+    list: The selected gamelog rows in scrape order, as dicts of column to text.
+    """
+    if GAME_DB_ENABLED:
+        columns = list(GAME_COLUMNS.values())
+        try:
+            connection = connect_read_only(filename)
+            try:
+                if is_synced(connection, gamelog_filename):
+                    increment('game_db_reads', source='db')
+                    cursor = connection.execute(f"SELECT {', '.join(columns)} FROM games WHERE {where} ORDER BY rowid", parameters)
+                    return [
+                        {field: to_csv_value(column, value) for (field, column), value in zip(GAME_COLUMNS.items(), record)}
+                        for record in cursor
+                    ]
+            finally:
+                connection.close()
+        except sqlite3.Error:
+            # No database yet, or one written before the gamelogs table existed
+            pass
+        print(f"{filename} is not in sync with {gamelog_filename}; reading the CSV instead "
+              f"(run nhl_game_db.py to import the gamelogs again)")
+
+    increment('game_db_reads', source='csv')
+    return [row for row in read_csv_rows(gamelog_filename) if matches(row)]
+
+
+def read_game_rows(filename, gamelog_filename):
+    """
+    Loads a gamelog's games from the database, in scrape order, as the same rows csv.DictReader
+    reads from the gamelog CSV. The CSV is read instead when the database is disabled or out of sync.
+
+    Parameters:
+    filename (str): The SQLite database.
+    gamelog_filename (str): The gamelog CSV whose games to load.
+
+    Returns:
+    list: The gamelog rows as dicts of column to text.
+    """
+    return query_games(filename, gamelog_filename, "gamelog = ?", (gamelog_name(gamelog_filename),), lambda row: True)
+
+
+def games_for_team(team, gamelog_filename, filename=GAME_DB_FILENAME):
+    """All games of a team in a gamelog, home and away, in scrape order."""
+    # The unary + keeps SQLite off the primary key, so each side of the OR is a seek on its own index
+    return query_games(
+        filename, gamelog_filename, "+gamelog = ? AND (away_team = ? OR home_team = ?)",
+        (gamelog_name(gamelog_filename), team, team),
+        lambda row: team in (row['Away Team'], row['Home Team'])
+    )
+
+
+def games_for_goalie(goalie, gamelog_filename, filename=GAME_DB_FILENAME):
+    """All games a goalie started in a gamelog, home and away, in scrape order."""
+    return query_games(
+        filename, gamelog_filename, "+gamelog = ? AND (away_goalie = ? OR home_goalie = ?)",
+        (gamelog_name(gamelog_filename), goalie, goalie),
+        lambda row: goalie in (row['Away Goalie'], row['Home Goalie'])
+    )
+
+
+# Function to load existing gamelog CSVs into the database
+def import_gamelog(gamelog_filename, filename=GAME_DB_FILENAME):
+    """
+    Replaces a gamelog's games in the database with the rows of its CSV, for gamelogs scraped
+    before the database existed.
+
+    Returns:
+    int: The number of games imported.
+    """
+    # Taken before the read, so a CSV appended to meanwhile is seen as out of sync
+    version = csv_version(gamelog_filename)
+    with open(gamelog_filename, mode='r', newline='', encoding='utf-8') as file:
+        rows = list(csv.DictReader(file))
+
+    connection = connect(filename)
+    try:
+        with connection:
+            delete_games(connection, gamelog_filename)
+            insert_games(connection, gamelog_filename, rows)
+            mark_synced(connection, gamelog_filename, version)
+    finally:
+        connection.close()
+
+    return len(rows)
+
+
+def main():
+    for gamelog_filename in ['nhl_fp_gamelog.csv', 'nhl_sp_gamelog.csv', 'nhl_tp_gamelog.csv']:
+        if os.path.exists(gamelog_filename):
+            rows_imported = import_gamelog(gamelog_filename)
+            print(f"Imported {rows_imported} games from {gamelog_filename} into {GAME_DB_FILENAME}")
+
+if __name__ == '__main__':
+    main()
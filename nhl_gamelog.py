@@ -0,0 +1,601 @@
+import requests
+import csv
+from datetime import datetime, timedelta
+from functools import partial
+from urllib.parse import urljoin
+from concurrent.futures import ThreadPoolExecutor
+import nhl_game_db
+from nhl_http import fetch_page, print_cache_report
+from nhl_espn_summary import fetch_box_score_lines, player_url
+from nhl_metrics import increment, print_stage_report, timed, write_run_summary
+from nhl_goalie_cache import cached_goalie_profile, flush_goalie_cache, print_goalie_cache_report
+from nhl_gamelog_store import GAMELOG_FIELDNAMES, append_new_games, backfill, progress_filename, read_scraped_games
+from nhl_parse import make_soup, BOX_SCORE_REGIONS, GOALIE_REGIONS, SCOREBOARD_REGIONS
+from nhl_scrape_engine import CONCURRENT_DATES, scrape_dates
+
+
+# User-Agent header to avoid getting blocked
+headers = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+# Maximum number of box score pages fetched concurrently for a single date
+MAX_WORKERS = 8
+
+# Periods scraped from a box score: the linescore column holding the period's goals (column 0 is the team),
+# the goalie TOI (in minutes) from which the goalie is credited with the whole period, and the period's gamelog.
+# The nhl_fp_, nhl_sp_ and nhl_tp_ scrapers bind one period; this module's main scrapes all of them in one pass.
+PERIODS = {
+    'fp': {'column': 1, 'toi_threshold': 20, 'filename': 'nhl_fp_gamelog.csv'},
+    'sp': {'column': 2, 'toi_threshold': 40, 'filename': 'nhl_sp_gamelog.csv'},
+    'tp': {'column': 3, 'toi_threshold': 50, 'filename': 'nhl_tp_gamelog.csv'},
+}
+
+EMPTY_BOX_SCORE = (None, None, None, None, None, None, None, None, None, None)
+
+def remove_periods(last_name):
+    """
+    Removes all periods from the given last name.
+
+    Parameters:
+    last_name (str): The last name to be checked and modified.
+
+    Returns:
+    str: The modified last name with all periods removed.
+    """
+    return last_name.replace(".", "")
+
+
+def parse_goalie_gaa(soup, goalie_url):
+    # Find the specific stat block container
+    stat_container = soup.find('aside', class_='StatBlock br-5 ba overflow-hidden flex-expand StatBlock--multiple bg-clr-white brdr-clr-gray-06 PlayerHeader__StatBlock')
+
+    # If stat_container is None, print an error message and return
+    if not stat_container:
+        print(f"Error: Stat container not found on goalie page {goalie_url}")
+        return None
+
+    # Find the ul element within the stat block container
+    stat_list = stat_container.find('ul', class_='StatBlock__Content flex list ph4 pv3 justify-between')
+    if not stat_list:
+        print(f"Error: Stat list not found on goalie page {goalie_url}")
+        return None
+
+    # Find all li elements within the ul element
+    li_elements = stat_list.find_all('li', class_='flex-expand')
+    if len(li_elements) < 2:
+        print(f"Error: Not enough li elements found on goalie page {goalie_url}")
+        return None
+
+    # Find the div with the class "StatBlockInner" in the second li element
+    gaa_info = li_elements[1].find('div', class_='StatBlockInner')
+    if not gaa_info:
+        print(f"Error: GAA info div not found on goalie page {goalie_url}")
+        return None
+
+    # Try to find the GAA value div using more generalized classes
+    gaa_value_div = gaa_info.find('div', class_='StatBlockInner__Value')
+    if not gaa_value_div:
+        # Print the content of gaa_info for debugging
+        print(f"Debug: GAA info div content: {gaa_info}")
+        print(f"Error: GAA value div not found on goalie page {goalie_url}")
+        return None
+
+    # Extract the text and strip any surrounding whitespace
+    gaa_number = gaa_value_div.text.strip()
+    return gaa_number
+
+
+def parse_goalie_name(soup, goalie_url):
+    # Find the specific stat block container
+    name_container = soup.find('div', class_='PlayerHeader__Main_Aside min-w-0 flex-grow flex-basis-0')
+
+    if not name_container:
+        print(f"Error: Name container not found on goalie page {goalie_url}")
+        return None
+
+    name_container_inner = name_container.find('h1')
+
+    if not name_container_inner:
+        print(f"Error: Name heading not found on goalie page {goalie_url}")
+        return None
+
+    name_parts = name_container_inner.find_all('span')
+
+    if len(name_parts) < 2:
+        print(f"Error: Name parts not found on goalie page {goalie_url}")
+        return None
+
+    first_name = name_parts[0].text.strip()
+    last_name = name_parts[1].text.strip()
+
+    last_name = remove_periods(last_name)
+    first_name = remove_periods(first_name)
+
+    full_name = f"{first_name} {last_name}"
+
+    return full_name
+
+
+def fetch_goalie_profile(goalie_url):
+    """
+    Fetches a goalie's ESPN page once and extracts both the full name and the season GAA from it.
+
+    Parameters:
+    goalie_url (str): The ESPN player page of the goalie.
+
+    Returns:
+    tuple: (full_name, gaa), either of which is None if it could not be scraped.
+
+    Raises:
+    requests.RequestException: If the page could not be fetched, so the date is retried instead of logged without GAAs.
+    """
+    headers = {'User-Agent': 'Mozilla/5.0'}
+    try:
+        html = fetch_page(goalie_url, 'goalie', headers)
+        soup = make_soup(html, GOALIE_REGIONS)
+
+        # Debugging prints
+        print("Goalie page fetched successfully")
+
+        return parse_goalie_name(soup, goalie_url), parse_goalie_gaa(soup, goalie_url)
+
+    except requests.RequestException as e:
+        print(f"Request error for goalie URL {goalie_url}: {e}")
+        raise
+
+
+def scrape_goalie_profile(goalie_url):
+    # A goalie starts dozens of games a season, so the page is fetched at most once per scrape day
+    return cached_goalie_profile(goalie_url, fetch_goalie_profile)
+
+
+def empty_box_scores(periods):
+    return {period: EMPTY_BOX_SCORE for period in periods}
+
+
+def normalize_goalie_line(goalie_toi, goalie_ga, opponent_goals, toi_threshold):
+    """
+    Credits a goalie who stayed in past toi_threshold minutes with all of the opponent's period goals.
+
+    Parameters:
+    goalie_toi (str): The goalie's full-game TOI minutes.
+    goalie_ga (str): The goalie's full-game goals against.
+    opponent_goals (str): The opponent's goals in the period.
+    toi_threshold (int): The TOI from which the goalie is credited with the whole period.
+
+    Returns:
+    tuple: (toi, ga) as written to the period gamelog.
+    """
+    if float(goalie_toi) >= toi_threshold:
+        return 20, opponent_goals
+    return goalie_toi, goalie_ga
+
+
+# Function to build each period's box score from a game's period goals and starting goalie lines
+def box_scores_for_periods(period_goals, away_goalie, home_goalie, away_goalie_url, home_goalie_url,
+                           away_goalie_toi, home_goalie_toi, away_goalie_ga, home_goalie_ga):
+    # Each goalie page is fetched once and shared by every period
+    away_goalie_full_name, away_gaa = scrape_goalie_profile(away_goalie_url)
+    home_goalie_full_name, home_gaa = scrape_goalie_profile(home_goalie_url)
+
+    if away_gaa and home_gaa and away_goalie_full_name and home_goalie_full_name:
+        away_goalie = away_goalie_full_name
+        home_goalie = home_goalie_full_name
+    else:
+        away_gaa = home_gaa = None
+
+    box_scores = {}
+    for period, (away_team_goals, home_team_goals) in period_goals.items():
+        toi_threshold = PERIODS[period]['toi_threshold']
+        away_toi, away_ga = normalize_goalie_line(away_goalie_toi, away_goalie_ga, home_team_goals, toi_threshold)
+        home_toi, home_ga = normalize_goalie_line(home_goalie_toi, home_goalie_ga, away_team_goals, toi_threshold)
+        box_scores[period] = (away_team_goals, home_team_goals, away_goalie, home_goalie, away_toi, home_toi, away_ga, home_ga, away_gaa, home_gaa)
+
+    return box_scores
+
+
+# Function to scrape a box score page once for the given periods
+def scrape_box_score_html(periods, box_score_url):
+    """
+    Scrapes a box score page once and builds the box score of each of the given periods.
+
+    Parameters:
+    periods (list): PERIODS keys to build, e.g. ['fp'].
+    box_score_url (str): The ESPN box score URL.
+
+    Returns:
+    dict: Period key to its 10-tuple (away_team_goals, home_team_goals, away_goalie, home_goalie, away_goalie_toi,
+    home_goalie_toi, away_goalie_ga, home_goalie_ga, away_gaa, home_gaa), with None for values that could not be scraped.
+
+    Raises:
+    requests.RequestException: If the box score or a goalie page could not be fetched.
+    """
+    try:
+        html = fetch_page(box_score_url, 'boxscore', headers)
+        soup = make_soup(html, BOX_SCORE_REGIONS)
+
+        # Debugging prints
+        print("Box score page fetched successfully")
+
+        # Extract the linescore table holding each team's period goals
+        table = soup.find('table', class_='Table Table--align-right')
+        if not table:
+            print("Error: Table not found")
+            return empty_box_scores(periods)
+
+        rows = table.find('tbody').find_all('tr', class_='Table__TR Table__TR--sm Table__even')
+        if len(rows) != 2:
+            print("Error: Could not retrieve period goals")
+            return empty_box_scores(periods)
+
+        row_cells = [row.find_all('td') for row in rows]
+        period_goals = {
+            period: (row_cells[0][PERIODS[period]['column']].text.strip(), row_cells[1][PERIODS[period]['column']].text.strip())
+            for period in periods
+        }
+
+        def partial_box_scores(*values):
+            return {
+                period: goals + values + (None,) * (8 - len(values))
+                for period, goals in period_goals.items()
+            }
+
+        soup_inner = soup.find('div', class_='Boxscore Boxscore__ResponsiveWrapper')
+
+        # Extract starting goalies
+        player_sections = soup_inner.find_all('div', class_='Wrapper')
+        if len(player_sections) < 2:
+            print("Error: Not enough player sections found")
+            return partial_box_scores()
+
+        # The second div with class 'Boxscore flex flex-column' of each team is for the goalies
+        away_goalie_table = player_sections[0].find_all('div', class_='Boxscore flex flex-column')[1]
+        home_goalie_table = player_sections[1].find_all('div', class_='Boxscore flex flex-column')[1]
+
+        away_goalies = away_goalie_table.find_all('a', class_='AnchorLink truncate db Boxscore__AthleteName')
+        home_goalies = home_goalie_table.find_all('a', class_='AnchorLink truncate db Boxscore__AthleteName')
+
+        base_url = 'https://www.espn.com'
+
+        if away_goalies and home_goalies:
+            away_goalie = away_goalies[0].text.strip()
+            home_goalie = home_goalies[0].text.strip()
+            away_goalie_url = player_url(urljoin(base_url, away_goalies[0]['href']))
+            home_goalie_url = player_url(urljoin(base_url, home_goalies[0]['href']))
+        else:
+            print("Error: Could not retrieve goalie names")
+            return partial_box_scores()
+
+        # Extract starting goalies' time on ice and goals against
+        away_goalie_boxscore = away_goalie_table.find('div', class_='Table__ScrollerWrapper relative overflow-hidden').find_all('tr', class_='Table__TR Table__TR--sm Table__even')[1]
+        home_goalie_boxscore = home_goalie_table.find('div', class_='Table__ScrollerWrapper relative overflow-hidden').find_all('tr', class_='Table__TR Table__TR--sm Table__even')[1]
+
+        away_goalie_stats = away_goalie_boxscore.find_all('td', class_="Table__TD")
+        home_goalie_stats = home_goalie_boxscore.find_all('td', class_="Table__TD")
+
+        if away_goalie_stats and home_goalie_stats:
+            away_goalie_ga = away_goalie_stats[1].text.strip()
+            away_goalie_toi = away_goalie_stats[9].text.strip().split(':')[0]
+            home_goalie_ga = home_goalie_stats[1].text.strip()
+            home_goalie_toi = home_goalie_stats[9].text.strip().split(':')[0]
+        else:
+            print("Error: Could not retrieve goalie stats")
+            return partial_box_scores(away_goalie, home_goalie)
+
+        return box_scores_for_periods(
+            period_goals, away_goalie, home_goalie, away_goalie_url, home_goalie_url,
+            away_goalie_toi, home_goalie_toi, away_goalie_ga, home_goalie_ga
+        )
+
+    except requests.RequestException as e:
+        print(f"Request error for box score URL {box_score_url}: {e}")
+        raise
+
+
+# Function to scrape a box score once for the given periods, from the game summary JSON when it has the game
+@timed('extract')
+def scrape_box_score(periods, box_score_url):
+    """
+    Scrapes a box score once and builds the box score of each of the given periods, reading ESPN's game
+    summary JSON and falling back to the box score page. The summary gives the same linescore and goalie
+    lines as the page, so both sources produce identical rows.
+
+    Parameters:
+    periods (list): PERIODS keys to build, e.g. ['fp'].
+    box_score_url (str): The ESPN box score URL.
+
+    Returns:
+    dict: Period key to the same 10-tuple scrape_box_score_html returns.
+    """
+    lines = fetch_box_score_lines(box_score_url, headers)
+    if lines is None:
+        increment('box_scores', source='html')
+        return scrape_box_score_html(periods, box_score_url)
+    increment('box_scores', source='summary')
+
+    # Debugging prints
+    print("Game summary fetched successfully")
+
+    away_linescore, home_linescore = lines['linescores']
+    period_goals = {
+        period: (away_linescore[PERIODS[period]['column']], home_linescore[PERIODS[period]['column']])
+        for period in periods
+    }
+    return box_scores_for_periods(
+        period_goals, lines['away_goalie'], lines['home_goalie'], lines['away_goalie_url'], lines['home_goalie_url'],
+        lines['away_goalie_toi'], lines['home_goalie_toi'], lines['away_goalie_ga'], lines['home_goalie_ga']
+    )
+
+
+# Function to scrape several box scores at once, yielding each result as soon as it is ready
+def iter_box_scores(periods, box_score_urls, max_workers=MAX_WORKERS):
+    """
+    Scrapes a list of box scores, fetching up to max_workers of them in parallel.
+
+    Parameters:
+    periods (list): PERIODS keys to build.
+    box_score_urls (list): The box score URLs to scrape.
+    max_workers (int): The maximum number of box scores in flight at once. 1 scrapes serially.
+
+    Yields:
+    dict: The scrape_box_score results, in the same order as box_score_urls.
+    """
+    for box_score_url in box_score_urls:
+        print(f"Fetching box score for URL: {box_score_url}")
+
+    if max_workers <= 1 or len(box_score_urls) <= 1:
+        for box_score_url in box_score_urls:
+            yield scrape_box_score(periods, box_score_url)
+        return
+
+    # executor.map yields results in submission order, so rows keep the scoreboard order
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        yield from executor.map(partial(scrape_box_score, periods), box_score_urls)
+
+
+# Function to scrape a single day's games for the given periods, yielding rows as box scores are scraped
+def iter_games(periods, date, max_workers=MAX_WORKERS):
+    """
+    Scrapes a date's games once and builds the gamelog rows of each of the given periods.
+
+    Parameters:
+    periods (list): PERIODS keys to build rows for.
+    date (str): The date to scrape, as YYYYMMDD.
+    max_workers (int): The maximum number of box scores in flight at once.
+
+    Yields:
+    tuple: (period key, gamelog row), in scoreboard order.
+
+    Raises:
+    requests.RequestException: If the scoreboard, a box score or a goalie page could not be fetched. A game that
+    is on the page but not finished is skipped, while a fetch that failed fails the whole date, so the backfill
+    and the update retry it on their next run instead of logging the date without the game.
+    """
+    url = f'http://espn.com/nhl/scoreboard/_/date/{date}'
+
+    try:
+        html = fetch_page(url, 'scoreboard', headers)
+        soup = make_soup(html, SCOREBOARD_REGIONS)
+
+        # Extract all sections that contain game information
+        games = soup.find_all('section', class_='Scoreboard bg-clr-white flex flex-auto justify-between')
+
+        if not games:
+            print(f"No games found for date: {date}")
+
+        # Collect the box score links in scoreboard order before fetching any of them
+        scheduled_games = []
+
+        with timed('extract'):
+            # Iterate over each game section and extract information
+            for game in games:
+                # Extract team names
+                teams = game.find_all('div', class_='ScoreCell__TeamName')
+                if len(teams) >= 2:
+                    away_team = teams[0].text.strip()
+                    home_team = teams[1].text.strip()
+
+                    # Extract the box score URL
+                    box_score_link = game.find('a', text='Box Score')
+                    if box_score_link:
+                        box_score_url = 'http://espn.com' + box_score_link['href']
+                        scheduled_games.append((away_team, home_team, box_score_url))
+                    else:
+                        print(f"No box score link found for game on {date}")
+
+        box_scores = iter_box_scores(periods, [box_score_url for _, _, box_score_url in scheduled_games], max_workers)
+
+        for (away_team, home_team, _), period_box_scores in zip(scheduled_games, box_scores):
+            for period, box_score in period_box_scores.items():
+                away_goals, home_goals, away_goalie, home_goalie, away_goalie_toi, home_goalie_toi, away_goalie_ga, home_goalie_ga, away_gaa, home_gaa = box_score
+                # A game is only logged with both goalie lines, since count_appearances needs their goals against
+                if away_goals is not None and home_goals is not None and away_goalie_ga is not None and home_goalie_ga is not None:
+                    # Create a dictionary with the scraped data
+                    yield period, {
+                        'Date': date,
+                        'Away Team': away_team,
+                        'Home Team': home_team,
+                        'Away Team Goals': away_goals,
+                        'Home Team Goals': home_goals,
+                        'Away Goalie': away_goalie,
+                        'Home Goalie': home_goalie,
+                        'Away Goalie TOI': away_goalie_toi,
+                        'Home Goalie TOI': home_goalie_toi,
+                        'Away Goalie GA': away_goalie_ga,
+                        'Home Goalie GA': home_goalie_ga,
+                        'Away GAA': away_gaa,
+                        'Home GAA': home_gaa
+                    }
+                else:
+                    print(f"Error retrieving {period} data for game on {date}")
+
+    except requests.RequestException as e:
+        print(f"Request error for date {date}: {e}")
+        raise
+
+
+def iter_games_all_periods(date, max_workers=MAX_WORKERS):
+    return iter_games(list(PERIODS), date, max_workers)
+
+
+def scrape_games_all_periods(date, max_workers=MAX_WORKERS):
+    """Scrapes a date's games once and returns a dict of period key to the list of gamelog rows."""
+    game_data = {period: [] for period in PERIODS}
+    for period, row in iter_games_all_periods(date, max_workers):
+        game_data[period].append(row)
+    return game_data
+
+
+# Function to save data to CSV
+def save_to_csv(filename, data):
+    with open(filename, mode='w', newline='', encoding='utf-8') as file:
+        writer = csv.DictWriter(file, fieldnames=GAMELOG_FIELDNAMES)
+        writer.writeheader()
+        for row in data:
+            writer.writerow(row)
+
+
+# Function to backfill the gamelogs of the given periods over a date range
+def backfill_periods(periods, start_date, end_date, checkpoint_filename, name):
+    """
+    Scrapes every date from start_date to end_date into the gamelogs of the given periods,
+    parsing each box score once for all of them, and prints the run's reports.
+
+    Parameters:
+    periods (list): PERIODS keys to scrape.
+    start_date (datetime): The first date to scrape.
+    end_date (datetime): The last date to scrape.
+    checkpoint_filename (str): Where the backfill's checkpoint is kept while it runs.
+    name (str): The script name the run summary is saved under, e.g. 'nhl_fp_gamelog'.
+    """
+    gamelog_filenames = {period: PERIODS[period]['filename'] for period in periods}
+
+    def scrape_date(date_str):
+        for period, row in iter_games(periods, date_str):
+            yield gamelog_filenames[period], row
+
+    # Dates are scraped CONCURRENT_DATES at a time under nhl_http.RATE_LIMIT, rows are written
+    # in date order, and each completed date is checkpointed, so rerunning after a crash resumes where it stopped
+    rows_written = backfill(
+        start_date, end_date, scrape_date, list(gamelog_filenames.values()), checkpoint_filename,
+        concurrent_dates=CONCURRENT_DATES
+    )
+
+    for period, gamelog_filename in gamelog_filenames.items():
+        if rows_written[gamelog_filename]:
+            print(f"Scraped data saved to {gamelog_filename}")
+        else:
+            print(f"No {period} data to save.")
+
+    print_cache_report()
+    print_goalie_cache_report()
+    print_stage_report()
+    print(f"Run summary saved to {write_run_summary(name)}")
+
+
+def update_csv_with_new_data(period, start_date, end_date, csv_filename, concurrent_dates=CONCURRENT_DATES):
+    """
+    Appends a period's games from start_date through end_date to its gamelog, skipping games already in it.
+
+    The update stops at the first date whose scrape fails and re-raises the error, leaving that date and every
+    later one out of the gamelog. The next update starts again from the gamelog's last Date, so it retries the
+    failed date, and the gamelog stays in date order.
+
+    Parameters:
+    period (str): The PERIODS key of the gamelog.
+    start_date (str): The first date to scrape, as YYYYMMDD.
+    end_date (str): The last date to scrape, as YYYYMMDD.
+    csv_filename (str): The gamelog CSV to update.
+    concurrent_dates (int): Dates scraped at once by nhl_scrape_engine.
+
+    Returns:
+    int: The number of rows added.
+
+    Raises:
+    Exception: Whatever the scrape of a date raised, e.g. requests.RequestException.
+    """
+    date_format = "%Y%m%d"
+    current_date = datetime.strptime(start_date, date_format)
+    end_date = datetime.strptime(end_date, date_format)
+
+    dates = []
+    while current_date <= end_date:
+        dates.append(current_date.strftime(date_format))
+        current_date += timedelta(days=1)
+
+    # Games already in the log are skipped, so rerunning a date range never duplicates rows
+    _, scraped_games = read_scraped_games(csv_filename)
+    rows_added = 0
+
+    def scrape_games(date_str):
+        # Scraped lazily, so a failed date raises in the loop below while date_str is that date
+        return (row for _, row in iter_games([period], date_str))
+
+    # One database connection serves the whole update; each date is written in one transaction
+    connection = nhl_game_db.connect(nhl_game_db.GAME_DB_FILENAME) if nhl_game_db.GAME_DB_ENABLED else None
+    # Dates are scraped concurrently and appended in date order
+    scraped_dates = scrape_dates(dates, scrape_games, concurrent_dates)
+    try:
+        for date_str, daily_games in scraped_dates:
+            print(f"Scraping data for date: {date_str}")
+            try:
+                # A date is only appended once all of its games are scraped
+                daily_games = list(daily_games)
+            except Exception as e:
+                increment('dates_failed')
+                print(f"Added {rows_added} games, then stopped at {date_str}, which could not be scraped ({e!r}); "
+                      f"the next update retries it")
+                raise
+            rows_added += append_new_games(csv_filename, daily_games, scraped_games, connection)
+            flush_goalie_cache()
+    finally:
+        scraped_dates.close()
+        if connection:
+            connection.close()
+
+    return rows_added
+
+
+def update_csv_incremental(period, csv_filename=None, end_date=None, concurrent_dates=CONCURRENT_DATES):
+    """
+    Brings a period's gamelog up to date by scraping only the dates it is missing.
+
+    The scrape starts at the last Date already in the log, since that date may have been cut short,
+    and runs through end_date. Games already in the log are skipped, so the update is safe to rerun,
+    and an update that stopped at a failed date retries it on the next run.
+
+    Parameters:
+    period (str): The PERIODS key of the gamelog.
+    csv_filename (str): The gamelog CSV to update. Defaults to the period's gamelog.
+    end_date (str): The last date to scrape, as YYYYMMDD. Defaults to yesterday.
+    concurrent_dates (int): Dates scraped at once by nhl_scrape_engine.
+
+    Returns:
+    int: The number of rows added.
+    """
+    csv_filename = csv_filename or PERIODS[period]['filename']
+    if end_date is None:
+        end_date = (datetime.now() - timedelta(days=1)).strftime("%Y%m%d")
+
+    last_date, _ = read_scraped_games(csv_filename)
+    if last_date is None:
+        print(f"No games in {csv_filename} yet; run the full scraper to build it first")
+        return 0
+
+    if last_date > end_date:
+        print(f"{csv_filename} is already up to date")
+        return 0
+
+    print(f"Updating {csv_filename} from {last_date} to {end_date}")
+    return update_csv_with_new_data(period, last_date, end_date, csv_filename, concurrent_dates)
+
+
+def main():
+    backfill_periods(
+        list(PERIODS), datetime.strptime('2024-10-04', '%Y-%m-%d'), datetime.strptime('2024-10-21', '%Y-%m-%d'),
+        progress_filename('nhl_gamelog'), 'nhl_gamelog'
+    )
+
+if __name__ == '__main__':
+    main()
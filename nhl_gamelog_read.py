@@ -0,0 +1,663 @@
+import csv
+import hashlib
+import io
+import json
+import os
+from collections import defaultdict, deque
+import numpy as np
+import pandas as pd
+from nhl_league import team_to_division
+from nhl_columnar import GAMELOG_DTYPES, STATS_DTYPES, export_columnar, is_columnar, read_gamelog_rows
+from nhl_files import atomic_write
+from nhl_game_db import is_game_db, read_game_rows
+from nhl_metrics import increment, print_stage_report, timed, write_run_summary
+
+
+# Periods the gamelogs are read for: the code in their counter columns (e.g. 'Away NGFP', 'Away NGSSP'),
+# the gamelog, the aggregation state kept between runs and the team and goalie data written from it
+PERIODS = {
+    'fp': {'code': 'FP', 'gamelog': 'nhl_fp_gamelog.csv', 'state': 'nhl_fp_aggregation_state.json',
+           'team_data': 'nhl_fp_team_data.csv', 'goalie_data': 'nhl_fp_goalie_data.csv'},
+    'sp': {'code': 'SP', 'gamelog': 'nhl_sp_gamelog.csv', 'state': 'nhl_sp_aggregation_state.json',
+           'team_data': 'nhl_sp_team_data.csv', 'goalie_data': 'nhl_sp_goalie_data.csv'},
+    'tp': {'code': 'TP', 'gamelog': 'nhl_tp_gamelog.csv', 'state': 'nhl_tp_aggregation_state.json',
+           'team_data': 'nhl_tp_team_data.csv', 'goalie_data': 'nhl_tp_goalie_data.csv'},
+}
+
+
+def field_name(column):
+    """The record attribute of a counter column, the same for every period, e.g. 'Away NG{code}' -> 'away_ng'."""
+    return column.replace('{code}', '').lower().replace(' ', '_')
+
+
+def period_columns(columns, period):
+    """Column templates spelled out for a period, e.g. 'Away NG{code}' -> 'Away NGFP'."""
+    code = PERIODS[period]['code']
+    return [column.format(code=code) for column in columns]
+
+
+class Counts:
+    """
+    Counters of one team or goalie. Slots keep the per-entity footprint small and let fold_game update
+    attributes instead of hashing column names; totals are derived when read instead of kept in step.
+    The columns are templates with the period's code left out, so one record type serves every period.
+    """
+    __slots__ = ()
+    columns = []
+
+    def __init__(self):
+        for name in self.__slots__:
+            setattr(self, name, 0)
+
+    def to_dict(self, period):
+        """The counters keyed by the period's column names, as kept in the aggregation state."""
+        return {
+            column: getattr(self, field_name(template))
+            for template, column in zip(self.columns, period_columns(self.columns, period))
+        }
+
+    @classmethod
+    def from_dict(cls, counts, period):
+        record = cls()
+        for template, column in zip(cls.columns, period_columns(cls.columns, period)):
+            # Derived totals have no slot and are skipped
+            if column in counts and field_name(template) in cls.__slots__:
+                setattr(record, field_name(template), counts[column])
+        return record
+
+
+# Counters kept for every team
+class TeamCounts(Counts):
+    columns = [
+        'Away', 'Away GS', 'Away GA', 'Away NG{code}', 'Away YG{code}', 'Away NGS{code}', 'Away YGS{code}',
+        'Home', 'Home GS', 'Home GA', 'Home NG{code}', 'Home YG{code}', 'Home NGS{code}', 'Home YGS{code}',
+        'Total NG{code}', 'Total YG{code}', 'Total NGS{code}', 'Total YGS{code}',
+        'Intra NG{code}', 'Intra YG{code}', 'Intra NGS{code}', 'Intra YGS{code}',
+        'L10 NGS{code}',  # The last 10 NGS results
+        'NGS{code} Streak', 'YGS{code} Streak'
+    ]
+    __slots__ = tuple(field_name(column) for column in columns if not column.startswith('Total')) + ('l10_streak',)
+
+    def __init__(self):
+        super().__init__()
+        self.l10_ngs = deque(maxlen=10)
+
+    def to_dict(self, period):
+        return dict(super().to_dict(period), **{period_columns(['L10 NGS{code}'], period)[0]: list(self.l10_ngs)})
+
+    @classmethod
+    def from_dict(cls, counts, period):
+        record = super().from_dict(counts, period)
+        record.l10_ngs = deque(counts[period_columns(['L10 NGS{code}'], period)[0]], maxlen=10)
+        return record
+
+    @property
+    def total_ng(self):
+        return self.away_ng + self.home_ng
+
+    @property
+    def total_yg(self):
+        return self.away_yg + self.home_yg
+
+    @property
+    def total_ngs(self):
+        return self.away_ngs + self.home_ngs
+
+    @property
+    def total_ygs(self):
+        return self.away_ygs + self.home_ygs
+
+
+# Counters kept for every goalie
+class GoalieCounts(Counts):
+    columns = [
+        'Away', 'Away GA', 'Away NG{code}', 'Away YG{code}',
+        'Home', 'Home GA', 'Home NG{code}', 'Home YG{code}',
+        'Total NG{code}', 'Total YG{code}',
+        'Season GAA',
+        'L5 NG{code}',  # The last 5 NG results
+        'NG{code} Streak', 'YG{code} Streak'
+    ]
+    __slots__ = tuple(field_name(column) for column in columns if not column.startswith('Total')) + ('l5_streak',)
+
+    def __init__(self):
+        super().__init__()
+        self.l5_ng = deque(maxlen=5)
+
+    def to_dict(self, period):
+        return dict(super().to_dict(period), **{period_columns(['L5 NG{code}'], period)[0]: list(self.l5_ng)})
+
+    @classmethod
+    def from_dict(cls, counts, period):
+        record = super().from_dict(counts, period)
+        record.l5_ng = deque(counts[period_columns(['L5 NG{code}'], period)[0]], maxlen=5)
+        return record
+
+    @property
+    def total_ng(self):
+        return self.away_ng + self.home_ng
+
+    @property
+    def total_yg(self):
+        return self.away_yg + self.home_yg
+
+
+# Columns of the team and goalie data written for each period
+TEAM_DATA_COLUMNS = [
+    'Name', 'Away', 'Away GS', 'Away GA', 'Away NG{code}', 'Away YG{code}', 'Away NGS{code}', 'Away YGS{code}',
+    'Home', 'Home GS', 'Home GA', 'Home NG{code}', 'Home YG{code}', 'Home NGS{code}', 'Home YGS{code}',
+    'Total NG{code}', 'Total YG{code}', 'Total NGS{code}', 'Total YGS{code}',
+    'Intra NG{code}', 'Intra YG{code}', 'Intra NGS{code}', 'Intra YGS{code}',
+    'L10 Streak',
+    'NGS{code} Streak', 'YGS{code} Streak'
+]
+
+GOALIE_DATA_COLUMNS = [
+    'Name', 'Away', 'Away GA', 'Away NG{code}', 'Away YG{code}', 'Away GAA',
+    'Home', 'Home GA', 'Home NG{code}', 'Home YG{code}', 'Home GAA',
+    'Total NG{code}', 'Total YG{code}', 'Season GAA',
+    'L5 Streak',
+    'NG{code} Streak', 'YG{code} Streak'
+]
+
+# Size of the blocks the gamelog prefix is hashed in
+STATE_HASH_BLOCK_BYTES = 1 << 20
+
+
+# Function to fold a single gamelog row into the team and goalie counts
+def fold_game(row, team_counts, goalie_counts):
+    away_goals = int(row['Away Team Goals'])
+    home_goals = int(row['Home Team Goals'])
+    away_goalie_goals = float(row['Away Goalie GA'])
+    home_goalie_goals = float(row['Home Goalie GA'])
+
+    away_team = team_counts[row['Away Team']]
+    home_team = team_counts[row['Home Team']]
+    away_goalie = goalie_counts[row['Away Goalie']]
+    home_goalie = goalie_counts[row['Home Goalie']]
+
+    ng = 1 if (home_goals + away_goals) == 0 else 0
+    away_ngs = 1 if away_goals == 0 else 0
+    home_ngs = 1 if home_goals == 0 else 0
+
+    # Update team counts; the totals are derived from the away and home counts
+    away_team.away += 1
+    away_team.away_gs += away_goals
+    away_team.away_ga += home_goals
+    away_team.away_ng += ng
+    away_team.away_yg += 1 - ng
+    away_team.away_ngs += away_ngs
+    away_team.away_ygs += 1 - away_ngs
+
+    home_team.home += 1
+    home_team.home_gs += home_goals
+    home_team.home_ga += away_goals
+    home_team.home_ng += ng
+    home_team.home_yg += 1 - ng
+    home_team.home_ngs += home_ngs
+    home_team.home_ygs += 1 - home_ngs
+
+    # Update intradivision counts
+    if team_to_division[row['Away Team']] == team_to_division[row['Home Team']]:
+        away_team.intra_ng += ng
+        away_team.intra_yg += 1 - ng
+        away_team.intra_ngs += away_ngs
+        away_team.intra_ygs += 1 - away_ngs
+
+        home_team.intra_ng += ng
+        home_team.intra_yg += 1 - ng
+        home_team.intra_ngs += home_ngs
+        home_team.intra_ygs += 1 - home_ngs
+
+    # Update goalie counts
+    away_goalie.away += 1
+    away_goalie.away_ga += away_goalie_goals
+    away_goalie.away_ng += 1 if away_goalie_goals == 0 else 0
+    away_goalie.away_yg += 1 if away_goalie_goals > 0 else 0
+    away_goalie.season_gaa = row['Away GAA']
+
+    home_goalie.home += 1
+    home_goalie.home_ga += home_goalie_goals
+    home_goalie.home_ng += 1 if home_goalie_goals == 0 else 0
+    home_goalie.home_yg += 1 if home_goalie_goals > 0 else 0
+    home_goalie.season_gaa = row['Home GAA']
+
+    # Update the last 10 NGS results for both teams
+    away_team.l10_ngs.append(away_ngs)
+    home_team.l10_ngs.append(home_ngs)
+    away_goalie.l5_ng.append(home_ngs)
+    home_goalie.l5_ng.append(away_ngs)
+
+    # Update NGS and YGS streaks for both teams
+    if away_goals == 0:
+        away_team.ngs_streak += 1
+        away_team.ygs_streak = 0
+        home_goalie.ng_streak += 1
+        home_goalie.yg_streak = 0
+    else:
+        away_team.ngs_streak = 0
+        away_team.ygs_streak += 1
+        home_goalie.ng_streak = 0
+        home_goalie.yg_streak += 1
+
+    if home_goals == 0:
+        home_team.ngs_streak += 1
+        home_team.ygs_streak = 0
+        away_goalie.ng_streak += 1
+        away_goalie.yg_streak = 0
+    else:
+        home_team.ngs_streak = 0
+        home_team.ygs_streak += 1
+        away_goalie.ng_streak = 0
+        away_goalie.yg_streak += 1
+
+
+def gamelog_prefix_hash(file, offset):
+    """
+    Hashes the gamelog's first offset bytes with SHA-256, so any edit to a row already counted is noticed.
+
+    Parameters:
+    file (file): The gamelog, opened in binary mode.
+    offset (int): The number of bytes counted so far.
+
+    Returns:
+    hashlib object: The running hash, which the rows counted next are added to before it is saved.
+    """
+    digest = hashlib.sha256()
+    file.seek(0)
+    remaining = offset
+    while remaining > 0:
+        block = file.read(min(remaining, STATE_HASH_BLOCK_BYTES))
+        if not block:
+            break
+        digest.update(block)
+        remaining -= len(block)
+    return digest
+
+
+def load_aggregation_state(period, state_filename, file, file_size):
+    """
+    Loads the counts saved by a previous count_appearances run, if they still describe the start of the gamelog.
+    Checking them reads the counted prefix once, so every run still takes time linear in the gamelog's size;
+    only parsing and folding are limited to the rows appended since.
+
+    Parameters:
+    period (str): The period the gamelog is for, a key of PERIODS.
+    state_filename (str): The aggregation state JSON file.
+    file (file): The gamelog, opened in binary mode.
+    file_size (int): The current size of the gamelog in bytes.
+
+    Returns:
+    tuple: (offset, fieldnames, team_counts, goalie_counts, prefix_hash), or None if the gamelog has to be folded
+    from the start. prefix_hash is the running hash of the first offset bytes.
+    """
+    try:
+        with open(state_filename, mode='r', encoding='utf-8') as state_file:
+            state = json.load(state_file)
+    except (OSError, ValueError):
+        return None
+
+    offset = state.get('offset', 0)
+    prefix_hash = gamelog_prefix_hash(file, offset) if offset <= file_size else None
+    # States saved before the whole counted prefix was hashed have no prefix_sha256 and are recounted
+    if prefix_hash is None or prefix_hash.hexdigest() != state.get('prefix_sha256'):
+        print(f"Gamelog changed before its last counted row since {state_filename} was saved; recounting from the start")
+        return None
+
+    team_counts = defaultdict(TeamCounts)
+    for team, counts in state['team_counts'].items():
+        team_counts[team] = TeamCounts.from_dict(counts, period)
+
+    goalie_counts = defaultdict(GoalieCounts)
+    for goalie, counts in state['goalie_counts'].items():
+        goalie_counts[goalie] = GoalieCounts.from_dict(counts, period)
+
+    return offset, state['fieldnames'], team_counts, goalie_counts, prefix_hash
+
+
+def save_aggregation_state(period, state_filename, offset, prefix_sha256, fieldnames, team_counts, goalie_counts):
+    state = {
+        'offset': offset,
+        'prefix_sha256': prefix_sha256,
+        'fieldnames': fieldnames,
+        'team_counts': {team: counts.to_dict(period) for team, counts in team_counts.items()},
+        'goalie_counts': {goalie: counts.to_dict(period) for goalie, counts in goalie_counts.items()}
+    }
+
+    with atomic_write(state_filename) as tmp_filename, open(tmp_filename, mode='w', encoding='utf-8') as state_file:
+        json.dump(state, state_file)
+
+
+# Function to count team and goalie appearances
+@timed('aggregate')
+def count_appearances(period, filename, state_filename=None):
+    """
+    Folds a period's gamelog into per-team and per-goalie counts.
+
+    With a state_filename, the counts and the byte offset they cover are saved after every run, and the
+    next run only folds the rows appended since, as long as the gamelog was only appended to.
+
+    Parameters:
+    period (str): The period the gamelog is for, a key of PERIODS.
+    filename (str): The gamelog CSV, or its columnar copy (see nhl_columnar) or the game database (see nhl_game_db),
+    which are always folded in full.
+    state_filename (str): Where the aggregation state of a CSV gamelog is kept between runs, or None to always count from the start.
+
+    Returns:
+    tuple: (team_counts, goalie_counts)
+    """
+    if is_columnar(filename) or is_game_db(filename):
+        team_counts = defaultdict(TeamCounts)
+        goalie_counts = defaultdict(GoalieCounts)
+        rows = read_gamelog_rows(filename) if is_columnar(filename) else read_game_rows(filename, PERIODS[period]['gamelog'])
+        for row in rows:
+            fold_game(row, team_counts, goalie_counts)
+        increment('games_aggregated', len(rows))
+    else:
+        team_counts, goalie_counts = fold_csv_gamelog(period, filename, state_filename)
+
+    # Calculate L10 streak for each team
+    for team, counts in team_counts.items():
+        counts.l10_streak = calculate_l10_streak(counts.l10_ngs)
+
+    for goalie, counts in goalie_counts.items():
+        counts.l5_streak = calculate_l5_streak(counts.l5_ng)
+
+    return team_counts, goalie_counts
+
+
+def read_gamelog_frame(period, filename):
+    """Load a gamelog CSV, columnar copy or game database as a DataFrame of the CSV's text values."""
+    if is_columnar(filename):
+        return pd.DataFrame(read_gamelog_rows(filename))
+    if is_game_db(filename):
+        return pd.DataFrame(read_game_rows(filename, PERIODS[period]['gamelog']))
+    return pd.read_csv(filename, dtype=str, keep_default_na=False)
+
+
+def stack_sides(away_values, home_values):
+    # The away side of game i becomes row 2i and the home side row 2i + 1, keeping game order
+    return np.column_stack([away_values, home_values]).ravel()
+
+
+def group_windows(codes, flags, window):
+    """
+    Runs the per-group window and streak of a stacked side table without a Python loop over games.
+
+    Parameters:
+    codes (ndarray): Group code of every row, numbered in order of first appearance.
+    flags (ndarray): The 0/1 result of every row, in game order.
+    window (int): The length of the last-N window.
+
+    Returns:
+    tuple: (windows, last_flags, run_lengths) per group: the last window results as lists,
+    the latest result and the length of the trailing run of equal results.
+    """
+    order = np.argsort(codes, kind='stable')
+    codes = codes[order]
+    flags = flags[order]
+    positions = np.arange(len(codes))
+
+    last_rows = np.append(np.flatnonzero(np.diff(codes)), len(codes) - 1)
+    first_rows = np.append(0, last_rows[:-1] + 1)
+
+    new_run = np.ones(len(codes), dtype=bool)
+    new_run[1:] = (flags[1:] != flags[:-1]) | (codes[1:] != codes[:-1])
+    run_starts = np.maximum.accumulate(np.where(new_run, positions, 0))
+
+    windows = [flags[max(first, last - window + 1):last + 1].tolist() for first, last in zip(first_rows, last_rows)]
+    return windows, flags[last_rows], last_rows - run_starts[last_rows] + 1
+
+
+# Function to count appearances with DataFrame operations instead of folding row by row
+@timed('aggregate')
+def count_appearances_vectorized(period, filename):
+    """
+    Builds the same team and goalie counts as count_appearances, from the home and away sides of
+    every game stacked into one table and aggregated with groupby. Always counts from the start.
+
+    Parameters:
+    period (str): The period the gamelog is for, a key of PERIODS.
+    filename (str): The gamelog CSV, or its columnar copy or the game database.
+
+    Returns:
+    tuple: (team_counts, goalie_counts), ordered and typed like count_appearances, so the saved CSVs are identical.
+    """
+    games = read_gamelog_frame(period, filename)
+    increment('games_aggregated', len(games))
+    team_counts = {}
+    goalie_counts = {}
+    if games.empty:
+        return team_counts, goalie_counts
+
+    # The period's result columns, e.g. NGFP, YGFP, NGSFP and YGSFP for the first period
+    ng, yg, ngs, ygs = period_columns(['NG{code}', 'YG{code}', 'NGS{code}', 'YGS{code}'], period)
+
+    away_goals = games['Away Team Goals'].to_numpy(dtype=int)
+    home_goals = games['Home Team Goals'].to_numpy(dtype=int)
+    intradivision = (games['Away Team'].map(team_to_division) == games['Home Team'].map(team_to_division)).to_numpy()
+    no_goals = (away_goals + home_goals == 0).astype(int)
+    away_side = stack_sides(np.ones(len(games), dtype=int), np.zeros(len(games), dtype=int))
+    home_side = 1 - away_side
+
+    # Teams are numbered in the order count_appearances first meets them, which is the order of its dicts
+    team_codes, team_names = pd.factorize(stack_sides(games['Away Team'], games['Home Team']))
+    goals_scored = stack_sides(away_goals, home_goals)
+    goals_allowed = stack_sides(home_goals, away_goals)
+    results = {
+        ng: stack_sides(no_goals, no_goals),
+        ngs: (goals_scored == 0).astype(int)
+    }
+    results[yg] = 1 - results[ng]
+    results[ygs] = 1 - results[ngs]
+    intra = stack_sides(intradivision, intradivision).astype(int)
+
+    team_sides = pd.DataFrame({
+        'Away': away_side, 'Away GS': goals_scored * away_side, 'Away GA': goals_allowed * away_side,
+        'Home': home_side, 'Home GS': goals_scored * home_side, 'Home GA': goals_allowed * home_side
+    })
+    for column in [ng, yg, ngs, ygs]:
+        team_sides[f'Away {column}'] = results[column] * away_side
+        team_sides[f'Home {column}'] = results[column] * home_side
+        team_sides[f'Total {column}'] = results[column]
+        team_sides[f'Intra {column}'] = results[column] * intra
+
+    team_columns = [column for column in period_columns(TeamCounts.columns, period) if column in team_sides]
+    teams = team_sides.groupby(team_codes)[team_columns].sum()
+
+    windows, last_flags, run_lengths = group_windows(team_codes, results[ngs], 10)
+    teams[f'{ngs} Streak'] = np.where(last_flags == 1, run_lengths, 0)
+    teams[f'{ygs} Streak'] = np.where(last_flags == 0, run_lengths, 0)
+
+    for team, counts, window in zip(team_names, teams.to_dict('records'), windows):
+        counts = TeamCounts.from_dict(dict(counts, **{f'L10 {ngs}': window}), period)
+        counts.l10_streak = calculate_l10_streak(counts.l10_ngs)
+        team_counts[team] = counts
+
+    # Goalies are stacked the same way; their window and streaks follow the opposing team's goals
+    goalie_codes, goalie_names = pd.factorize(stack_sides(games['Away Goalie'], games['Home Goalie']))
+    goals_against = stack_sides(games['Away Goalie GA'].to_numpy(dtype=float), games['Home Goalie GA'].to_numpy(dtype=float))
+    clean_sheets = (goals_against == 0).astype(int)
+    goalie_sides = pd.DataFrame({
+        'Away': away_side, 'Away GA': goals_against * away_side,
+        f'Away {ng}': clean_sheets * away_side, f'Away {yg}': (goals_against > 0) * away_side,
+        'Home': home_side, 'Home GA': goals_against * home_side,
+        f'Home {ng}': clean_sheets * home_side, f'Home {yg}': (goals_against > 0) * home_side,
+        f'Total {ng}': clean_sheets, f'Total {yg}': (goals_against > 0).astype(int)
+    })
+    goalies = goalie_sides.groupby(goalie_codes).sum()
+    # The Season GAA of a goalie's latest game, kept as the gamelog's text
+    goalies['Season GAA'] = pd.Series(stack_sides(games['Away GAA'], games['Home GAA'])).groupby(goalie_codes).last()
+
+    opponent_no_goals = stack_sides(home_goals == 0, away_goals == 0).astype(int)
+    windows, last_flags, run_lengths = group_windows(goalie_codes, opponent_no_goals, 5)
+    goalies[f'{ng} Streak'] = np.where(last_flags == 1, run_lengths, 0)
+    goalies[f'{yg} Streak'] = np.where(last_flags == 0, run_lengths, 0)
+
+    for goalie, counts, window in zip(goalie_names, goalies.to_dict('records'), windows):
+        # GA totals start as the int 0 and only become floats once a game is added, as in fold_game
+        for side in ['Away', 'Home']:
+            if counts[side] == 0:
+                counts[f'{side} GA'] = 0
+        counts = GoalieCounts.from_dict(dict(counts, **{f'L5 {ng}': window}), period)
+        counts.l5_streak = calculate_l5_streak(counts.l5_ng)
+        goalie_counts[goalie] = counts
+
+    return team_counts, goalie_counts
+
+
+def fold_csv_gamelog(period, filename, state_filename):
+    with open(filename, mode='rb') as file:
+        file_size = os.fstat(file.fileno()).st_size
+        state = load_aggregation_state(period, state_filename, file, file_size) if state_filename else None
+
+        if state:
+            offset, fieldnames, team_counts, goalie_counts, prefix_hash = state
+        else:
+            # Dictionaries to keep counts
+            team_counts = defaultdict(TeamCounts)
+            goalie_counts = defaultdict(GoalieCounts)
+
+            file.seek(0)
+            header = file.readline()
+            offset = len(header)
+            fieldnames = next(csv.reader([header.decode('utf-8')]))
+            prefix_hash = hashlib.sha256(header)
+
+        # Only fold complete lines; a row still being appended is picked up on the next run
+        file.seek(offset)
+        new_data = file.read()
+        new_data = new_data[:new_data.rfind(b'\n') + 1]
+        offset += len(new_data)
+        # The new rows extend the hash of the prefix, so the saved state never reads the gamelog again
+        prefix_hash.update(new_data)
+
+        # Read the CSV rows appended since the last run
+        reader = csv.DictReader(io.StringIO(new_data.decode('utf-8'), newline=''), fieldnames=fieldnames)
+        for row in reader:
+            fold_game(row, team_counts, goalie_counts)
+        increment('games_aggregated', reader.line_num)
+
+        if state_filename:
+            save_aggregation_state(
+                period, state_filename, offset, prefix_hash.hexdigest(), fieldnames, team_counts, goalie_counts
+            )
+
+    return team_counts, goalie_counts
+
+
+# Function to calculate the L10 streak for a team
+def calculate_l10_streak(l10_ngs):
+    return sum(l10_ngs)
+
+
+def calculate_l5_streak(l5_ng):
+    return sum(l5_ng)
+
+
+# Function to save team counts to CSV
+@timed('write')
+def save_team_counts_to_csv(period, filename, team_counts):
+    # Write to the CSV file
+    with open(filename, mode='w', newline='', encoding='utf-8') as file:
+        writer = csv.writer(file)
+
+        # Write header
+        writer.writerow(period_columns(TEAM_DATA_COLUMNS, period))
+
+        # Write team counts
+        for team, counts in team_counts.items():
+            writer.writerow([
+                team,
+                counts.away,
+                counts.away_gs,
+                counts.away_ga,
+                counts.away_ng,
+                counts.away_yg,
+                counts.away_ngs,
+                counts.away_ygs,
+                counts.home,
+                counts.home_gs,
+                counts.home_ga,
+                counts.home_ng,
+                counts.home_yg,
+                counts.home_ngs,
+                counts.home_ygs,
+                counts.total_ng,
+                counts.total_yg,
+                counts.total_ngs,
+                counts.total_ygs,
+                counts.intra_ng,
+                counts.intra_yg,
+                counts.intra_ngs,
+                counts.intra_ygs,
+                counts.l10_streak,
+                counts.ngs_streak,
+                counts.ygs_streak
+            ])
+
+# Function to save goalie counts to CSV
+@timed('write')
+def save_goalie_counts_to_csv(period, filename, goalie_counts):
+    # Write to the CSV file
+    with open(filename, mode='w', newline='', encoding='utf-8') as file:
+        writer = csv.writer(file)
+
+        # Write header
+        writer.writerow(period_columns(GOALIE_DATA_COLUMNS, period))
+
+        # Write goalie counts
+        for goalie, counts in goalie_counts.items():
+            away_gaa = round(counts.away_ga * 3 / counts.away, 2) if counts.away > 0 else 0
+            home_gaa = round(counts.home_ga * 3 / counts.home, 2) if counts.home > 0 else 0
+            writer.writerow([
+                goalie,
+                counts.away,
+                counts.away_ga,
+                counts.away_ng,
+                counts.away_yg,
+                away_gaa,
+                counts.home,
+                counts.home_ga,
+                counts.home_ng,
+                counts.home_yg,
+                home_gaa,
+                counts.total_ng,
+                counts.total_yg,
+                counts.season_gaa,
+                counts.l5_streak,
+                counts.ng_streak,
+                counts.yg_streak
+            ])
+
+
+# Function to read a period's gamelog and write its team and goalie data
+def read_period(period):
+    """
+    Counts a period's gamelog, resuming from its aggregation state, and writes the team and goalie data
+    with their columnar copies.
+
+    Parameters:
+    period (str): The period to read, a key of PERIODS.
+    """
+    config = PERIODS[period]
+    team_counts, goalie_counts = count_appearances(period, config['gamelog'], config['state'])
+    save_team_counts_to_csv(period, config['team_data'], team_counts)
+    save_goalie_counts_to_csv(period, config['goalie_data'], goalie_counts)
+
+    # Typed columnar copies read by count_appearances and the matchups apps; skipped without a Parquet engine
+    export_columnar(config['gamelog'], GAMELOG_DTYPES)
+    export_columnar(config['team_data'], STATS_DTYPES)
+    export_columnar(config['goalie_data'], STATS_DTYPES)
+
+
+def main():
+    for period in PERIODS:
+        read_period(period)
+
+    print_stage_report()
+    print(f"Run summary saved to {write_run_summary('nhl_gamelog_read')}")
+
+
+if __name__ == '__main__':
+    main()
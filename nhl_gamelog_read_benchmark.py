@@ -0,0 +1,93 @@
+import csv
+import os
+import random
+import tempfile
+import timeit
+from datetime import datetime, timedelta
+from nhl_gamelog_store import GAMELOG_FIELDNAMES
+from nhl_league import divisions
+from nhl_fp_gamelog_read import count_appearances, count_appearances_vectorized, save_goalie_counts_to_csv, save_team_counts_to_csv
+
+# Size of the synthetic gamelog: 10 regular seasons of 32 teams playing 82 games
+SEASONS = 10
+GAMES_PER_SEASON = 82 * 32 // 2
+GOALIES_PER_TEAM = 3
+
+# Number of timed runs of each implementation
+REPEAT = 3
+
+
+def write_synthetic_gamelog(filename, seasons=SEASONS, seed=0):
+    """
+    Writes a random gamelog shaped like nhl_fp_gamelog.csv: about one goal per team per period,
+    a starter picked from each team's goalies, and two-decimal season GAAs.
+
+    Returns:
+    int: The number of games written.
+    """
+    rng = random.Random(seed)
+    teams = [team for division_teams in divisions.values() for team in division_teams]
+    goalies = {team: [f"{team} Goalie {number}" for number in range(1, GOALIES_PER_TEAM + 1)] for team in teams}
+    date = datetime(2015, 10, 1)
+
+    with open(filename, mode='w', newline='', encoding='utf-8') as file:
+        writer = csv.DictWriter(file, fieldnames=GAMELOG_FIELDNAMES)
+        writer.writeheader()
+        for game_number in range(seasons * GAMES_PER_SEASON):
+            # Roughly eight games a day
+            if game_number % 8 == 0:
+                date += timedelta(days=1)
+            away_team, home_team = rng.sample(teams, 2)
+            away_goals = min(int(rng.expovariate(1.0)), 4)
+            home_goals = min(int(rng.expovariate(1.0)), 4)
+            writer.writerow({
+                'Date': date.strftime('%Y%m%d'),
+                'Away Team': away_team,
+                'Home Team': home_team,
+                'Away Team Goals': away_goals,
+                'Home Team Goals': home_goals,
+                'Away Goalie': rng.choice(goalies[away_team]),
+                'Home Goalie': rng.choice(goalies[home_team]),
+                'Away Goalie TOI': 20,
+                'Home Goalie TOI': 20,
+                'Away Goalie GA': home_goals,
+                'Home Goalie GA': away_goals,
+                'Away GAA': f"{rng.uniform(1.5, 4.0):.2f}",
+                'Home GAA': f"{rng.uniform(1.5, 4.0):.2f}"
+            })
+
+    return seasons * GAMES_PER_SEASON
+
+
+def saved_csvs(directory, name, counts):
+    team_counts, goalie_counts = counts
+    team_filename = os.path.join(directory, f"{name}_team_data.csv")
+    goalie_filename = os.path.join(directory, f"{name}_goalie_data.csv")
+    save_team_counts_to_csv(team_filename, team_counts)
+    save_goalie_counts_to_csv(goalie_filename, goalie_counts)
+    contents = []
+    for filename in (team_filename, goalie_filename):
+        with open(filename, mode='rb') as file:
+            contents.append(file.read())
+    return contents
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        gamelog_filename = os.path.join(directory, 'nhl_fp_gamelog.csv')
+        games = write_synthetic_gamelog(gamelog_filename)
+        print(f"Synthetic gamelog: {games} games over {SEASONS} seasons")
+
+        identical = saved_csvs(directory, 'loop', count_appearances(gamelog_filename)) == \
+            saved_csvs(directory, 'vectorized', count_appearances_vectorized(gamelog_filename))
+        print(f"Team and goalie CSVs identical: {identical}")
+
+        loop = min(timeit.repeat(lambda: count_appearances(gamelog_filename), number=1, repeat=REPEAT)) * 1000
+        vectorized = min(timeit.repeat(lambda: count_appearances_vectorized(gamelog_filename), number=1, repeat=REPEAT)) * 1000
+        print(f"{'Implementation':<16}{'Time (ms)':>12}")
+        print(f"{'Row loop':<16}{loop:>12.1f}")
+        print(f"{'Vectorized':<16}{vectorized:>12.1f}")
+        print(f"Speedup: {loop / vectorized:.1f}x")
+
+if __name__ == '__main__':
+    main()
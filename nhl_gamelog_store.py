@@ -0,0 +1,300 @@
+import csv
+import json
+import os
+import time
+from datetime import timedelta
+import nhl_game_db
+from nhl_files import atomic_write
+from nhl_goalie_cache import flush_goalie_cache
+from nhl_metrics import increment, timed
+from nhl_scrape_engine import scrape_dates
+
+
+# Columns of the fp, sp and tp gamelog CSVs
+GAMELOG_FIELDNAMES = [
+    'Date', 'Away Team', 'Home Team', 'Away Team Goals', 'Home Team Goals',
+    'Away Goalie', 'Home Goalie', 'Away Goalie TOI', 'Home Goalie TOI',
+    'Away Goalie GA', 'Home Goalie GA',
+    'Away GAA', 'Home GAA'
+]
+
+# Streamed rows are flushed to disk after this many rows or seconds, whichever comes first,
+# so partial output of a long backfill is visible while it runs
+FLUSH_ROWS = 50
+FLUSH_SECONDS = 5
+
+
+def progress_filename(filename):
+    return f"{filename}.progress.json"
+
+
+def load_progress(filename, start_date, end_date, gamelog_filenames):
+    """
+    Loads the checkpoint of an interrupted backfill over the same dates and gamelogs.
+
+    Returns:
+    dict: The checkpoint, or None if there is nothing to resume.
+    """
+    try:
+        with open(filename, mode='r', encoding='utf-8') as file:
+            progress = json.load(file)
+    except (OSError, ValueError):
+        return None
+
+    if (progress.get('start_date') != start_date.strftime('%Y%m%d')
+            or progress.get('end_date') != end_date.strftime('%Y%m%d')
+            or sorted(progress.get('sizes', {})) != sorted(gamelog_filenames)):
+        print(f"Ignoring checkpoint {filename}: it belongs to a different backfill")
+        return None
+
+    if any(not os.path.exists(gamelog_filename) or os.path.getsize(gamelog_filename) < size
+           for gamelog_filename, size in progress['sizes'].items()):
+        print(f"Ignoring checkpoint {filename}: the gamelogs were changed since it was written")
+        return None
+
+    return progress
+
+
+def save_progress(filename, progress):
+    with atomic_write(filename) as tmp_filename, open(tmp_filename, mode='w', encoding='utf-8') as file:
+        json.dump(progress, file)
+
+
+def append_rows(filename, rows):
+    with open(filename, mode='a', newline='', encoding='utf-8') as file:
+        writer = csv.DictWriter(file, fieldnames=GAMELOG_FIELDNAMES)
+        for row in rows:
+            writer.writerow(row)
+        file.flush()
+        os.fsync(file.fileno())
+
+
+class GamelogWriter:
+    """
+    Appends rows to a gamelog CSV as they are scraped, flushing them every FLUSH_ROWS rows or
+    FLUSH_SECONDS seconds. Any object with the same write, flush and close methods can be used as a sink.
+    """
+
+    def __init__(self, filename, flush_rows=FLUSH_ROWS, flush_seconds=FLUSH_SECONDS):
+        self.filename = filename
+        self.flush_rows = flush_rows
+        self.flush_seconds = flush_seconds
+        self.rows_written = 0
+        self.pending_rows = 0
+        self.last_flush = time.monotonic()
+        self.file = open(filename, mode='a', newline='', encoding='utf-8')
+        self.writer = csv.DictWriter(self.file, fieldnames=GAMELOG_FIELDNAMES)
+
+    def write(self, row):
+        self.writer.writerow(row)
+        self.rows_written += 1
+        self.pending_rows += 1
+        if self.pending_rows >= self.flush_rows or time.monotonic() - self.last_flush >= self.flush_seconds:
+            self.flush()
+
+    def flush(self, sync=False):
+        """Flushes the buffered rows; sync also forces them to disk, as needed before a checkpoint."""
+        self.file.flush()
+        if sync:
+            os.fsync(self.file.fileno())
+        self.pending_rows = 0
+        self.last_flush = time.monotonic()
+
+    def close(self):
+        self.flush(sync=True)
+        self.file.close()
+
+
+def iter_dates(start_date, end_date):
+    """Yields every date from start_date to end_date as a YYYYMMDD string."""
+    current_date = start_date
+    while current_date <= end_date:
+        yield current_date.strftime('%Y%m%d')
+        current_date += timedelta(days=1)
+
+
+def game_key(row):
+    """Identifies a game in a gamelog: teams only meet once per date."""
+    return str(row['Date']), row['Away Team'], row['Home Team']
+
+
+def read_scraped_games(filename):
+    """
+    Indexes the games already in a gamelog.
+
+    Parameters:
+    filename (str): The gamelog CSV.
+
+    Returns:
+    tuple: (last_date, scraped_games) - the latest Date in the gamelog as YYYYMMDD (None if it has
+    no rows or does not exist) and the set of game_key values it holds.
+    """
+    last_date = None
+    scraped_games = set()
+
+    if not os.path.exists(filename):
+        return last_date, scraped_games
+
+    with open(filename, mode='r', newline='', encoding='utf-8') as file:
+        for row in csv.DictReader(file):
+            scraped_games.add(game_key(row))
+            if last_date is None or row['Date'] > last_date:
+                last_date = row['Date']
+
+    return last_date, scraped_games
+
+
+def append_new_games(filename, rows, scraped_games, connection=None):
+    """
+    Appends the rows whose game is not in scraped_games yet, creating the gamelog if needed.
+
+    Parameters:
+    filename (str): The gamelog CSV.
+    rows (list): Scraped gamelog rows.
+    scraped_games (set): game_key values already in the gamelog; updated with the appended games.
+    connection (sqlite3.Connection): The game database the rows are also inserted into, or None to only write the CSV.
+
+    Returns:
+    int: The number of rows appended.
+    """
+    with timed('write'):
+        if not os.path.exists(filename):
+            with open(filename, mode='w', newline='', encoding='utf-8') as file:
+                csv.DictWriter(file, fieldnames=GAMELOG_FIELDNAMES).writeheader()
+
+        new_rows = []
+        for row in rows:
+            key = game_key(row)
+            if key not in scraped_games:
+                scraped_games.add(key)
+                new_rows.append(row)
+
+        if new_rows:
+            if connection is None:
+                append_rows(filename, new_rows)
+            else:
+                # The batch is committed to the database only once it is in the CSV, and rolled back if the
+                # CSV write fails; a failed commit leaves the database behind, which its reads detect.
+                # A database that was already behind the CSV stays marked as behind.
+                with connection:
+                    synced = nhl_game_db.is_synced(connection, filename)
+                    nhl_game_db.insert_games(connection, filename, new_rows)
+                    append_rows(filename, new_rows)
+                    if synced:
+                        nhl_game_db.mark_synced(connection, filename)
+            increment('rows_written', len(new_rows), gamelog=filename)
+
+    return len(new_rows)
+
+
+# Function to scrape a date range into gamelogs, checkpointing after every date
+def backfill(start_date, end_date, scrape_date, gamelog_filenames, checkpoint_filename, concurrent_dates=1):
+    """
+    Scrapes every date from start_date to end_date into the gamelogs, streaming each row to its gamelog
+    (and to the game database when it is enabled) as soon as it is scraped. Completed dates and gamelog
+    sizes are checkpointed to checkpoint_filename, so a rerun after a crash resumes at the first unfinished
+    date instead of starting over. The checkpoint is removed once the whole range is done.
+
+    A date whose scrape raises is not checkpointed: its rows are truncated away and the backfill stops there,
+    so the next run retries it. Later dates are not written past it, which keeps the gamelogs in date order.
+
+    Parameters:
+    start_date (datetime): The first date to scrape.
+    end_date (datetime): The last date to scrape.
+    scrape_date (callable): Takes a YYYYMMDD date string and returns an iterable of (gamelog filename, row)
+    pairs, ideally a generator so rows are written while the rest of the date is still being scraped.
+    gamelog_filenames (list): The gamelog CSVs written by the backfill.
+    checkpoint_filename (str): Where the checkpoint is kept while the backfill runs.
+    concurrent_dates (int): Dates scraped at once by nhl_scrape_engine; rows are still written in date order.
+
+    Returns:
+    dict: Gamelog filename to the number of rows it holds.
+
+    Raises:
+    Exception: Whatever the scrape of a date raised, e.g. requests.RequestException, once the date is rolled back.
+    """
+    progress = load_progress(checkpoint_filename, start_date, end_date, gamelog_filenames)
+    connection = nhl_game_db.connect(nhl_game_db.GAME_DB_FILENAME) if nhl_game_db.GAME_DB_ENABLED else None
+
+    if progress is None:
+        for gamelog_filename in gamelog_filenames:
+            with open(gamelog_filename, mode='w', newline='', encoding='utf-8') as file:
+                csv.DictWriter(file, fieldnames=GAMELOG_FIELDNAMES).writeheader()
+            if connection:
+                with connection:
+                    nhl_game_db.delete_games(connection, gamelog_filename)
+                    nhl_game_db.mark_synced(connection, gamelog_filename)
+        progress = {
+            'start_date': start_date.strftime('%Y%m%d'),
+            'end_date': end_date.strftime('%Y%m%d'),
+            'completed_dates': [],
+            'sizes': {gamelog_filename: os.path.getsize(gamelog_filename) for gamelog_filename in gamelog_filenames},
+            'rows': {gamelog_filename: 0 for gamelog_filename in gamelog_filenames}
+        }
+        save_progress(checkpoint_filename, progress)
+    else:
+        print(f"Resuming backfill after {len(progress['completed_dates'])} completed dates")
+        # Drop rows of a date that was being written when the last run stopped
+        for gamelog_filename, size in progress['sizes'].items():
+            os.truncate(gamelog_filename, size)
+
+    completed_dates = set(progress['completed_dates'])
+    resumed_rows = dict(progress['rows'])
+    writers = {gamelog_filename: GamelogWriter(gamelog_filename) for gamelog_filename in gamelog_filenames}
+
+    pending_dates = [date_str for date_str in iter_dates(start_date, end_date) if date_str not in completed_dates]
+    scraped_dates = scrape_dates(pending_dates, scrape_date, concurrent_dates)
+
+    try:
+        for date_str, rows in scraped_dates:
+            print(f"Scraping data for {date_str}")
+            if connection:
+                # Drop games of this date a crashed run stored before it was checkpointed
+                for gamelog_filename in gamelog_filenames:
+                    nhl_game_db.delete_games(connection, gamelog_filename, date_str)
+
+            try:
+                for gamelog_filename, row in rows:
+                    with timed('write'):
+                        writers[gamelog_filename].write(row)
+                        increment('rows_written', gamelog=gamelog_filename)
+                        if connection:
+                            nhl_game_db.insert_games(connection, gamelog_filename, [row])
+            except Exception as e:
+                # Roll the date back to the last checkpoint, which the next run resumes from
+                for gamelog_filename, writer in writers.items():
+                    writer.flush()
+                    os.truncate(gamelog_filename, progress['sizes'][gamelog_filename])
+                if connection:
+                    connection.rollback()
+                increment('dates_failed')
+                print(f"Stopped at {date_str}, which could not be scraped ({e!r}); rerun to retry it")
+                raise
+
+            with timed('write'):
+                # Only a fully written date is checkpointed; a resume truncates anything written after it
+                for gamelog_filename, writer in writers.items():
+                    writer.flush(sync=True)
+                    # The database holds the date's games if it held every game at the last checkpoint
+                    if connection and nhl_game_db.synced_size(connection, gamelog_filename) == progress['sizes'][gamelog_filename]:
+                        nhl_game_db.mark_synced(connection, gamelog_filename)
+                    progress['sizes'][gamelog_filename] = os.path.getsize(gamelog_filename)
+                    progress['rows'][gamelog_filename] = resumed_rows[gamelog_filename] + writer.rows_written
+                if connection:
+                    connection.commit()
+
+                progress['completed_dates'].append(date_str)
+                save_progress(checkpoint_filename, progress)
+                flush_goalie_cache()
+            increment('dates_scraped')
+    finally:
+        # Dates still being scraped ahead are stopped when the backfill stops early
+        scraped_dates.close()
+        for writer in writers.values():
+            writer.close()
+        if connection:
+            connection.close()
+
+    os.remove(checkpoint_filename)
+
+    return progress['rows']
@@ -0,0 +1,154 @@
+import atexit
+import json
+import re
+import threading
+from datetime import datetime
+from nhl_files import atomic_write
+from nhl_metrics import increment, timed
+
+# Goalie profiles (full name and season GAA) shared by the fp, sp and tp scrapers, keyed by ESPN player id.
+# The name never changes, so it is kept for good; the GAA moves after every game, so it is refetched once per scrape day.
+GOALIE_CACHE_FILENAME = 'nhl_goalie_cache.json'
+GOALIE_CACHE_ENABLED = True
+
+PLAYER_ID_PATTERN = re.compile(r'/id/(\d+)')
+
+
+def goalie_id(goalie_url):
+    """The ESPN player id in a goalie page URL, or the URL itself if it has none."""
+    match = PLAYER_ID_PATTERN.search(goalie_url)
+    return match.group(1) if match else goalie_url
+
+
+def scrape_day():
+    return datetime.now().strftime('%Y%m%d')
+
+
+class GoalieCache:
+    """
+    Goalie profiles by ESPN player id, saved to a JSON file so later runs start warm.
+    Each goalie is looked up under its own lock, so box scores scraped in parallel fetch a page only once.
+    Lookups only mark the cache dirty; the scrapers flush it once per date and at exit.
+    """
+
+    def __init__(self, filename=GOALIE_CACHE_FILENAME):
+        self.filename = filename
+        self.profiles = None
+        self.lock = threading.Lock()
+        self.goalie_locks = {}
+        self.stats = {'hits': 0, 'misses': 0}
+        self.dirty = False
+        self.save_lock = threading.Lock()
+
+    def load(self):
+        try:
+            with open(self.filename, mode='r', encoding='utf-8') as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def save(self, profiles):
+        with atomic_write(self.filename) as tmp_filename, open(tmp_filename, mode='w', encoding='utf-8') as file:
+            json.dump(profiles, file, indent=1, sort_keys=True)
+
+    def flush(self):
+        """Saves the cache if a lookup changed it since the last flush."""
+        with self.save_lock:
+            with self.lock:
+                if not self.dirty:
+                    return
+                # Profiles are replaced, never changed in place, so a shallow copy is a consistent snapshot
+                profiles = dict(self.profiles)
+                self.dirty = False
+            # Written outside the lookup lock, so lookups on other threads carry on meanwhile
+            self.save(profiles)
+
+    def goalie_lock(self, player_id):
+        with self.lock:
+            if self.profiles is None:
+                self.profiles = self.load()
+            return self.goalie_locks.setdefault(player_id, threading.Lock())
+
+    def get_profile(self, goalie_url, scrape_profile):
+        """
+        Returns a goalie's full name and season GAA, scraping the goalie page only when the GAA
+        has not been fetched yet today.
+
+        Parameters:
+        goalie_url (str): The ESPN player page of the goalie.
+        scrape_profile (callable): Takes the goalie URL and returns (full_name, gaa), as scrape_goalie_profile does.
+
+        Returns:
+        tuple: (full_name, gaa), either of which is None if it could not be scraped.
+        """
+        player_id = goalie_id(goalie_url)
+        today = scrape_day()
+
+        goalie_lock = self.goalie_lock(player_id)
+        # Another thread fetching the same goalie holds the lock; the wait is not extraction time
+        with timed('wait'):
+            goalie_lock.acquire()
+        try:
+            profile = self.profiles.get(player_id, {})
+            if profile.get('name') is not None and profile.get('gaa') is not None and profile.get('gaa_day') == today:
+                with self.lock:
+                    self.stats['hits'] += 1
+                increment('goalie_profiles', result='hit')
+                return profile['name'], profile['gaa']
+
+            full_name, gaa = scrape_profile(goalie_url)
+            increment('goalie_profiles', result='miss')
+
+            with self.lock:
+                self.stats['misses'] += 1
+                # A failed scrape keeps what is known; the name already cached wins over a rescraped one
+                profile = dict(profile)
+                if profile.get('name') is None and full_name is not None:
+                    profile['name'] = full_name
+                if gaa is not None:
+                    profile['gaa'] = gaa
+                    profile['gaa_day'] = today
+                if profile:
+                    self.profiles[player_id] = profile
+                    self.dirty = True
+
+            return profile.get('name'), gaa
+        finally:
+            goalie_lock.release()
+
+
+goalie_cache = GoalieCache()
+
+
+def flush_goalie_cache():
+    """Saves the goalie cache's changes, as the scrapers do after every date."""
+    goalie_cache.flush()
+
+
+# Lookups made after the last date was flushed, e.g. by a run stopped midway, are saved at exit
+atexit.register(flush_goalie_cache)
+
+
+# Function to look up a goalie's profile through the shared goalie cache
+def cached_goalie_profile(goalie_url, scrape_profile):
+    """
+    Returns (full_name, gaa) for a goalie page, from the goalie cache when GOALIE_CACHE_ENABLED.
+
+    Parameters:
+    goalie_url (str): The ESPN player page of the goalie.
+    scrape_profile (callable): Scrapes (full_name, gaa) from the goalie page on a cache miss.
+
+    Returns:
+    tuple: (full_name, gaa), either of which is None if it could not be scraped.
+    """
+    if not GOALIE_CACHE_ENABLED:
+        return scrape_profile(goalie_url)
+    return goalie_cache.get_profile(goalie_url, scrape_profile)
+
+
+def print_goalie_cache_report():
+    """Prints the goalie profile cache hit/miss counts of this run."""
+    stats = goalie_cache.stats
+    lookups = stats['hits'] + stats['misses']
+    hit_rate = round(stats['hits'] / lookups * 100, 1) if lookups > 0 else 0
+    print(f"Goalie profile cache: {stats['hits']} hits, {stats['misses']} misses ({hit_rate}% hit rate)")
@@ -0,0 +1,311 @@
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from urllib.parse import urlparse
+from nhl_files import atomic_write
+from nhl_metrics import increment, timed
+
+
+# HTTP client settings shared by every scraper; change them with configure_session
+POOL_SIZE = 16  # Keep-alive connections per host, at least the scrapers' MAX_WORKERS
+RETRIES = 3
+BACKOFF_FACTOR = 0.5  # Retries wait 0.5s, 1s, 2s, ...
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+TIMEOUT = 15  # Seconds, for both connecting and reading
+
+_session = None
+_session_lock = threading.Lock()
+
+# Requests per second allowed per host, with bursts of up to RATE_BURST requests. The default keeps a backfill
+# (CONCURRENT_DATES dates with MAX_WORKERS box scores each, plus their goalie pages) polite to ESPN while a full
+# pool of requests can still start at once; change it with configure_rate_limit, or pass None to stop throttling.
+# Cached pages and replayed fixtures never count against the limit.
+RATE_LIMIT = 5
+RATE_BURST = POOL_SIZE
+
+_buckets = {}
+_buckets_lock = threading.Lock()
+
+# Directory holding cached ESPN pages, shared by the fp, sp and tp scrapers
+CACHE_DIR = '.nhl_http_cache'
+CACHE_ENABLED = True
+
+# How long a cached page stays fresh, per page type.
+# None never expires, 'daily' expires at midnight, a number is a TTL in seconds.
+CACHE_TTLS = {
+    'scoreboard': 60 * 60,
+    'boxscore': None,  # Box scores are only scraped for finished games, so they never change
+    'summary': None,  # Game summaries are read for the same finished games
+    'goalie': 'daily',  # Season GAA moves after every game
+}
+
+# Recorded pages for offline runs, kept in the same layout as the cache; change them with configure_fixtures.
+# 'record' saves every page the scrapers read, 'replay' serves pages only from FIXTURES_DIR and never touches the network.
+FIXTURES_DIR = 'nhl_fixtures'
+FIXTURES_MODE = None
+
+cache_stats = {page_type: {'hits': 0, 'misses': 0} for page_type in CACHE_TTLS}
+_stats_lock = threading.Lock()
+
+
+def build_session(pool_size, retries, backoff_factor):
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=['GET'],
+        raise_on_status=False  # Hand the last response back so raise_for_status reports it
+    )
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def configure_session(pool_size=None, retries=None, backoff_factor=None, timeout=None):
+    """
+    Replaces the shared session with one using the given settings. Settings left as None keep their current value.
+
+    Parameters:
+    pool_size (int): Keep-alive connections kept per host.
+    retries (int): Retries for connection errors and RETRY_STATUSES responses.
+    backoff_factor (float): Base of the exponential wait between retries, in seconds.
+    timeout (float): Connect and read timeout of each request, in seconds.
+    """
+    global _session, POOL_SIZE, RETRIES, BACKOFF_FACTOR, TIMEOUT
+
+    with _session_lock:
+        POOL_SIZE = POOL_SIZE if pool_size is None else pool_size
+        RETRIES = RETRIES if retries is None else retries
+        BACKOFF_FACTOR = BACKOFF_FACTOR if backoff_factor is None else backoff_factor
+        TIMEOUT = TIMEOUT if timeout is None else timeout
+
+        if _session is not None:
+            _session.close()
+        _session = build_session(POOL_SIZE, RETRIES, BACKOFF_FACTOR)
+
+
+def get_session():
+    global _session
+
+    with _session_lock:
+        if _session is None:
+            _session = build_session(POOL_SIZE, RETRIES, BACKOFF_FACTOR)
+        return _session
+
+
+class TokenBucket:
+    """Thread-safe token bucket: refills rate tokens per second up to burst, and each request takes one."""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Blocks until a token is available, then takes it."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+def configure_rate_limit(rate, burst=1):
+    """
+    Sets the per-host request rate shared by every thread and the scraping engine.
+
+    Parameters:
+    rate (float): Requests per second allowed to each host, or None to stop throttling.
+    burst (int): Requests a host can receive back to back after being idle.
+    """
+    global RATE_LIMIT, RATE_BURST
+
+    with _buckets_lock:
+        RATE_LIMIT = rate
+        RATE_BURST = burst
+        _buckets.clear()
+
+
+def wait_for_rate_limit(url):
+    if RATE_LIMIT is None:
+        return
+
+    host = urlparse(url).hostname
+    with _buckets_lock:
+        bucket = _buckets.get(host)
+        if bucket is None:
+            bucket = _buckets[host] = TokenBucket(RATE_LIMIT, RATE_BURST)
+    with timed('wait'):
+        bucket.acquire()
+
+
+# Function to send a GET request over the shared keep-alive session
+def http_get(url, headers=None):
+    """
+    Sends a GET request through the shared session, reusing pooled connections and retrying transient failures.
+    Waits for the host's rate limit first when one is configured.
+
+    Parameters:
+    url (str): The page URL.
+    headers (dict): The HTTP headers to send.
+
+    Returns:
+    requests.Response: The response, with raise_for_status already applied.
+
+    Raises:
+    requests.RequestException: If the request still fails after the retries.
+    """
+    wait_for_rate_limit(url)
+    response = get_session().get(url, headers=headers, timeout=TIMEOUT)
+    increment('http_responses', host=urlparse(url).hostname, status=response.status_code)
+    response.raise_for_status()  # Raise an exception for HTTP errors
+    return response
+
+
+def cache_path(url, directory=None):
+    """
+    Builds the on-disk location of a cached page from the SHA-256 of its URL.
+
+    Parameters:
+    url (str): The page URL.
+    directory (str): The directory holding the pages. Defaults to CACHE_DIR.
+
+    Returns:
+    str: The path of the cached body; its metadata lives next to it with a .json suffix.
+    """
+    key = hashlib.sha256(url.encode('utf-8')).hexdigest()
+    return os.path.join(directory or CACHE_DIR, key[:2], f"{key}.html")
+
+
+def is_fresh(fetched_at, ttl):
+    if ttl is None:
+        return True
+    if ttl == 'daily':
+        return datetime.fromtimestamp(fetched_at).date() == datetime.now().date()
+    return time.time() - fetched_at < ttl
+
+
+def read_cache(url, page_type):
+    path = cache_path(url)
+    try:
+        with open(path + '.json', mode='r', encoding='utf-8') as file:
+            meta = json.load(file)
+        if meta.get('url') != url or not is_fresh(meta['fetched_at'], CACHE_TTLS[page_type]):
+            return None
+        with open(path, mode='r', encoding='utf-8') as file:
+            return file.read()
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def write_cache(url, text, directory=None):
+    path = cache_path(url, directory)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    with atomic_write(path) as tmp_filename, open(tmp_filename, mode='w', encoding='utf-8') as file:
+        file.write(text)
+    with atomic_write(path + '.json') as tmp_filename, open(tmp_filename, mode='w', encoding='utf-8') as file:
+        json.dump({'url': url, 'fetched_at': time.time()}, file)
+
+
+def configure_fixtures(mode, directory=None):
+    """
+    Switches fetch_page between fetching pages normally, recording them as fixtures and replaying them.
+
+    Parameters:
+    mode (str): 'record', 'replay', or None to fetch pages normally.
+    directory (str): The fixtures directory. None keeps FIXTURES_DIR.
+    """
+    global FIXTURES_MODE, FIXTURES_DIR
+
+    if mode not in (None, 'record', 'replay'):
+        raise ValueError(f"Unknown fixtures mode: {mode}")
+    FIXTURES_MODE = mode
+    FIXTURES_DIR = FIXTURES_DIR if directory is None else directory
+
+
+def read_fixture(url):
+    path = cache_path(url, FIXTURES_DIR)
+    try:
+        with open(path + '.json', mode='r', encoding='utf-8') as file:
+            if json.load(file).get('url') == url:
+                with open(path, mode='r', encoding='utf-8') as file:
+                    return file.read()
+    except (OSError, ValueError):
+        pass
+    # Scrapers already handle request errors, so a page that was never recorded is skipped like a failed fetch
+    raise requests.ConnectionError(f"No recorded fixture for {url}")
+
+
+def record_cache_lookup(page_type, hit):
+    with _stats_lock:
+        cache_stats[page_type]['hits' if hit else 'misses'] += 1
+
+
+# Function to fetch a page, going through the on-disk cache when a page type is given
+def fetch_page(url, page_type=None, headers=None):
+    """
+    Returns the body of a page, served from the on-disk cache when a fresh copy exists.
+    Replaying fixtures serves every page from FIXTURES_DIR instead; recording saves every page there.
+
+    Parameters:
+    url (str): The page URL.
+    page_type (str): One of the CACHE_TTLS keys, or None to always fetch over the network.
+    headers (dict): The HTTP headers to send on a cache miss.
+
+    Returns:
+    str: The page body.
+
+    Raises:
+    requests.RequestException: If the page is not cached and the request fails, or was never recorded when replaying.
+    """
+    with timed('fetch'):
+        if FIXTURES_MODE == 'replay':
+            text = read_fixture(url)
+            increment('pages_fetched', page_type=page_type or 'none', source='fixture')
+            return text
+
+        use_cache = CACHE_ENABLED and page_type is not None
+        text = None
+
+        if use_cache:
+            text = read_cache(url, page_type)
+            record_cache_lookup(page_type, text is not None)
+
+        if text is None:
+            text = http_get(url, headers=headers).text
+            increment('pages_fetched', page_type=page_type or 'none', source='network')
+            if use_cache:
+                write_cache(url, text)
+        else:
+            increment('pages_fetched', page_type=page_type or 'none', source='cache')
+
+        if FIXTURES_MODE == 'record':
+            write_cache(url, text, FIXTURES_DIR)
+
+        return text
+
+
+def print_cache_report():
+    """Prints the cache hit/miss counts of this run, per page type."""
+    print("HTTP cache report:")
+    for page_type, stats in cache_stats.items():
+        lookups = stats['hits'] + stats['misses']
+        hit_rate = round(stats['hits'] / lookups * 100, 1) if lookups > 0 else 0
+        print(f"  {page_type}: {stats['hits']} hits, {stats['misses']} misses ({hit_rate}% hit rate)")
@@ -0,0 +1,32 @@
+# League metadata shared by the gamelog readers, the matchups apps and the lineups scraper.
+# Every lookup table is built once at import time.
+
+# Define divisions
+divisions = {
+    'Atlantic': ['Red Wings', 'Lightning', 'Panthers', 'Canadiens', 'Maple Leafs', 'Bruins', 'Sabres', 'Senators'],
+    'Central': ['Stars', 'Blues', 'Wild', 'Predators', 'Jets', 'Utah Hockey Club', 'Blackhawks', 'Avalanche'],
+    'Metropolitan': ['Devils', 'Islanders', 'Capitals', 'Rangers', 'Hurricanes', 'Flyers', 'Penguins', 'Blue Jackets'],
+    'Pacific': ['Kraken', 'Sharks', 'Flames', 'Golden Knights', 'Canucks', 'Ducks', 'Kings', 'Oilers'],
+}
+
+# Define conferences
+conferences = {
+    'Eastern': ['Atlantic', 'Metropolitan'],
+    'Western': ['Central', 'Pacific'],
+}
+
+# Names other sites use for a team, mapped to the name used in the gamelogs and stats CSVs
+TEAM_ALIASES = {
+    'Hockey Club': 'Utah Hockey Club',  # Rotogrinders lists Utah by its placeholder mascot
+}
+
+team_to_division = {team: division for division, teams in divisions.items() for team in teams}
+
+division_to_conference = {division: conference for conference, conference_divisions in conferences.items() for division in conference_divisions}
+
+team_to_conference = {team: division_to_conference[division] for team, division in team_to_division.items()}
+
+
+def canonical_team_name(name):
+    """Return the gamelog name of a team, resolving TEAM_ALIASES; unknown names are returned unchanged."""
+    return TEAM_ALIASES.get(name, name)
@@ -0,0 +1,362 @@
+from flask import render_template
+import pandas as pd
+import datetime
+import unicodedata
+import numpy as np
+import os
+import threading
+from nhl_league import team_to_division
+from nhl_columnar import read_table
+from nhl_gamelog_read import PERIODS, period_columns
+from nhl_metrics import increment
+
+
+def format_goalie_name(name):
+    """
+    Convert goalie name from 'Figst Last' to 'F. Last' and handle three-word names.
+    Handles special charactegs by normalizing to ASCII.
+    """
+    # Normalize the name to remove accents and other diacritics
+    normalized_name = unicodedata.normalize('NFKD', name).encode('ASCII', 'ignore').decode('ASCII')
+
+    # # Split the normalized name into parts
+    # parts = normalized_name.split()
+    #
+    # if len(parts) == 2:
+    #     return f"{parts[0][0]}. {parts[1]}"
+    # elif len(parts) == 3:
+    #     return f"{parts[0][0]}. {parts[1]} {parts[2]}"
+    return normalized_name
+
+def calculate_min_max(df, column):
+    """Calculate the min and max values of a column in a DataFrame."""
+    if column in df:
+        return df[column].min(), df[column].max()
+    return None, None
+
+def rgb_colors(red, green, missing):
+    """Build 'rgb(r,g,0)' strings from red and green channels, white where missing."""
+    red = np.nan_to_num(red).astype(int)
+    green = np.nan_to_num(green).astype(int)
+    colors = [f'rgb({r},{g},0)' for r, g in zip(red, green)]
+    return np.where(missing, '#ffffff', colors)
+
+def calculate_color(values, min_val, max_val, inverse=False):
+    """Calculate colors based on values, min, and max. NaN values are white."""
+    values = np.asarray(values, dtype=float)
+    ratio = (values - min_val) / (max_val - min_val)
+    # Truncate toward zero, like int()
+    high = np.trunc(255 * ratio)
+    low = np.trunc(255 * (1 - ratio))
+    if inverse:
+        return rgb_colors(low, high, np.isnan(values))
+    return rgb_colors(high, low, np.isnan(values))
+
+def calculate_ng_color(values, min_val=0, max_val=100):
+    """Calculate colors for NG percentages based on a fixed scale (0 to 100). NaN values are white."""
+    values = np.asarray(values, dtype=float)
+    # Ensure values are within the min-max range
+    ratio = (np.clip(values, min_val, max_val) - min_val) / (max_val - min_val)
+    green = np.trunc(255 * ratio)   # Higher percentage (closer to 100) is more green
+    red = np.trunc(255 * (1 - ratio))  # Lower percentage (closer to 0) is more red
+    return rgb_colors(red, green, np.isnan(values))
+
+def calculate_ngs_color(values, min_val=50, max_val=100):
+    """Calculate colors for NGS percentages based on a fixed scale (50 to 100). NaN values are white."""
+    return calculate_ng_color(values, min_val, max_val)
+
+def calculate_era_color(values, min_val=0, max_val=9):
+    """Calculate colors based on values scaled from 0 to 9. NaN values are white."""
+    values = np.asarray(values, dtype=float)
+    # Scale values from 0 to 9
+    scaled_values = 9 * (np.clip(values, min_val, max_val) - min_val) / (max_val - min_val)
+
+    # Map scaled values to a color gradient
+    red = np.trunc(255 * (scaled_values / 9))
+    green = np.trunc(255 * (1 - scaled_values / 9))
+    return rgb_colors(red, green, np.isnan(values))
+
+def calculate_streak_color(values, missing):
+    """Green while an NG-type streak is running, red otherwise, 'N/A' where missing."""
+    return np.where(missing, 'N/A', np.where(np.asarray(values) > 0, '#00FF00', '#FF0000'))
+
+def safe_percentage(numerators, denominators):
+    """Whole-number percentages, NaN where the denominator is 0 or missing."""
+    return np.rint(numerators / denominators.where(denominators != 0) * 100)
+
+def whole_numbers(values):
+    """Python ints for display, 'N/A' where the value is NaN."""
+    return [int(value) if not pd.isna(value) else 'N/A' for value in values]
+
+def decimals(values, missing):
+    """Python floats for display (NaN included), 'N/A' where the row's inputs are missing."""
+    return ['N/A' if is_missing else float(value) for value, is_missing in zip(values, missing)]
+
+def rounded_decimals(values, missing):
+    """Like decimals, rounded to one decimal place with Python's round."""
+    return ['N/A' if is_missing else round(float(value), 1) for value, is_missing in zip(values, missing)]
+
+
+# Lineups shared by every period; each period's team and goalie data are its 'team_data' and 'goalie_data' in PERIODS
+LINEUPS_FILE = 'nhl_lineups.csv'
+
+# Page template of each period
+TEMPLATES = {
+    'fp': 'nhl_display_fp_matchups_data.html',
+    'sp': 'nhl_display_sp_matchups_data.html',
+    'tp': 'nhl_display_tp_matchups_data.html',
+}
+
+def file_version(filename):
+    """Identify the current contents of a file by its modification time and size."""
+    stat = os.stat(filename)
+    return stat.st_mtime_ns, stat.st_size
+
+# Stats tables loaded once and reused across requests, keyed by filename
+stats_tables = {}
+
+def load_stats_table(filename):
+    """
+    Load a team or goalie stats CSV along with its rows indexed by Name.
+    The parsed table is reused across requests until the file changes.
+    """
+    version = file_version(filename)
+    cached = stats_tables.get(filename)
+    if cached is not None and cached[0] == version:
+        return cached[1], cached[2]
+
+    # Read from the typed columnar copy when it is current
+    data_df = read_table(filename)
+    # Index the rows on Name, keeping the first row of a name as the per-matchup lookups did
+    data_by_name = data_df.drop_duplicates('Name').set_index('Name')
+
+    stats_tables[filename] = (version, data_df, data_by_name)
+    return data_df, data_by_name
+
+
+def compute_matchups(period, matchups_df=None):
+    """
+    Compute the row of every matchup in the lineups, with a period's stats, percentages, colors and algo scores.
+    period is a key of PERIODS; matchups_df is the lineups table to use, read from LINEUPS_FILE when not given.
+    """
+    # The period's result columns, e.g. NGFP, YGFP, NGSFP and YGSFP for the first period
+    ng, yg, ngs, ygs = period_columns(['NG{code}', 'YG{code}', 'NGS{code}', 'YGS{code}'], period)
+
+    # Load data from the existing CSV files
+    if matchups_df is None:
+        matchups_df = pd.read_csv(LINEUPS_FILE)
+    team_data_df, team_data_by_name = load_stats_table(PERIODS[period]['team_data'])
+    goalie_data_df, goalie_data_by_name = load_stats_table(PERIODS[period]['goalie_data'])
+
+    # Calculate min and max values for relevant columns
+    team_min_max = {
+        'Away GS': calculate_min_max(team_data_df, 'Away GS'),
+        'Home GS': calculate_min_max(team_data_df, 'Home GS')
+    }
+
+    goalie_min_max = {
+        f'Away {ng}': calculate_min_max(goalie_data_df, f'Away {ng}'),
+        f'Away {yg}': calculate_min_max(goalie_data_df, f'Away {yg}'),
+        f'Home {ng}': calculate_min_max(goalie_data_df, f'Home {ng}'),
+        f'Home {yg}': calculate_min_max(goalie_data_df, f'Home {yg}')
+    }
+
+    # Join every matchup to the stats of its teams and goalies; names without stats get NaN
+    formatted_away_goalies = matchups_df['Away Goalie'].map(format_goalie_name)
+    formatted_home_goalies = matchups_df['Home Goalie'].map(format_goalie_name)
+
+    away_team = team_data_by_name.reindex(matchups_df['Away Team']).reset_index(drop=True)
+    home_team = team_data_by_name.reindex(matchups_df['Home Team']).reset_index(drop=True)
+    away_goalie = goalie_data_by_name.reindex(formatted_away_goalies).reset_index(drop=True)
+    home_goalie = goalie_data_by_name.reindex(formatted_home_goalies).reset_index(drop=True)
+
+    away_team_missing = ~matchups_df['Away Team'].isin(team_data_by_name.index)
+    home_team_missing = ~matchups_df['Home Team'].isin(team_data_by_name.index)
+    away_goalie_missing = ~formatted_away_goalies.isin(goalie_data_by_name.index)
+    home_goalie_missing = ~formatted_home_goalies.isin(goalie_data_by_name.index)
+
+    # Calculate team NG percentages
+    away_ng_percent = safe_percentage(away_team[f'Away {ng}'], away_team[f'Away {ng}'] + away_team[f'Away {yg}'])
+    home_ng_percent = safe_percentage(home_team[f'Home {ng}'], home_team[f'Home {ng}'] + home_team[f'Home {yg}'])
+    away_ngs_percent = safe_percentage(away_team[f'Away {ngs}'], away_team[f'Away {ngs}'] + away_team[f'Away {ygs}'])
+    home_ngs_percent = safe_percentage(home_team[f'Home {ngs}'], home_team[f'Home {ngs}'] + home_team[f'Home {ygs}'])
+    away_total_ng_percent = safe_percentage(away_team[f'Total {ng}'], away_team[f'Total {ng}'] + away_team[f'Total {yg}'])
+    home_total_ng_percent = safe_percentage(home_team[f'Total {ng}'], home_team[f'Total {ng}'] + home_team[f'Total {yg}'])
+    away_total_ngs_percent = safe_percentage(away_team[f'Total {ngs}'], away_team[f'Total {ngs}'] + away_team[f'Total {ygs}'])
+    home_total_ngs_percent = safe_percentage(home_team[f'Total {ngs}'], home_team[f'Total {ngs}'] + home_team[f'Total {ygs}'])
+
+    # Intradivision percentages are only shown for intradivision games where the away team has intra NGS games
+    intradivision_game = matchups_df['Away Team'].map(team_to_division).eq(matchups_df['Home Team'].map(team_to_division))
+    show_intra = intradivision_game & (away_team[f'Intra {ngs}'] > 0)
+    away_intra_ngs_percent = np.rint(away_team[f'Intra {ngs}'] / (away_team[f'Intra {ngs}'] + away_team[f'Intra {ygs}']) * 100).where(show_intra)
+    home_intra_ngs_percent = np.rint(home_team[f'Intra {ngs}'] / (home_team[f'Intra {ngs}'] + home_team[f'Intra {ygs}']) * 100).where(show_intra)
+
+    # Calculate goalie NG percentages; 0 / 0 stays NaN
+    away_ng_goalie_percent = (away_goalie[f'Away {ng}'] / (away_goalie[f'Away {ng}'] + away_goalie[f'Away {yg}']) * 100).round(1)
+    home_ng_goalie_percent = (home_goalie[f'Home {ng}'] / (home_goalie[f'Home {ng}'] + home_goalie[f'Home {yg}']) * 100).round(1)
+    away_total_ng_goalie_percent = (away_goalie[f'Total {ng}'] / (away_goalie[f'Total {ng}'] + away_goalie[f'Total {yg}']) * 100).round(1)
+    home_total_ng_goalie_percent = (home_goalie[f'Total {ng}'] / (home_goalie[f'Total {ng}'] + home_goalie[f'Total {yg}']) * 100).round(1)
+    ng_goalies_percent = np.rint(home_ng_goalie_percent * away_ng_goalie_percent / 100)
+
+    # Current streaks: the NGS streak while it is running, the YGS streak otherwise
+    away_streak = away_team[f'{ngs} Streak'].where(away_team[f'{ngs} Streak'] > 0, away_team[f'{ygs} Streak'])
+    home_streak = home_team[f'{ngs} Streak'].where(home_team[f'{ngs} Streak'] > 0, home_team[f'{ygs} Streak'])
+    away_goalie_streak = away_goalie[f'{ng} Streak'].where(away_goalie[f'{ng} Streak'] > 0, away_goalie[f'{yg} Streak'])
+    home_goalie_streak = home_goalie[f'{ng} Streak'].where(home_goalie[f'{ng} Streak'] > 0, home_goalie[f'{yg} Streak'])
+
+    def goalie_algo(ng_goalie_percent, total_ng_goalie_percent, goalie, side):
+        """Goalie algo score, with a mask of the goalies that have enough games and a running streak."""
+        available = (
+            ((goalie[f'{side} {ng}'] + goalie[f'{side} {yg}']) >= 2)
+            & ((goalie[f'Total {ng}'] + goalie[f'Total {yg}']) >= 5)
+            & ((goalie[f'{ng} Streak'] > 0) | (goalie[f'{yg} Streak'] > 0))
+        )
+        base = ((ng_goalie_percent * 2) + total_ng_goalie_percent) / 3 + (3 * (goalie['L5 Streak'] - 2))
+        algo = np.where(goalie[f'{ng} Streak'] > 0, base + (2 * goalie[f'{ng} Streak']), base - (2 * goalie[f'{yg} Streak']))
+        return pd.Series(algo, index=goalie.index), available
+
+    def team_algo(ngs_percent, intra_ngs_percent, team):
+        """Team algo score, with a mask of the teams that have a running streak."""
+        available = (team[f'{ngs} Streak'] > 0) | (team[f'{ygs} Streak'] > 0)
+        with_intra = (((ngs_percent * 5) + (intra_ngs_percent * 3) + ((team['L10 Streak'] / 10) * 3)) / 12)
+        without_intra = (((ngs_percent * 7) + ((team['L10 Streak'] / 10) * 5)) / 12)
+        base = with_intra.where(intra_ngs_percent.notna(), without_intra)
+        algo = np.where(team[f'{ngs} Streak'] > 0, base + (2 * team[f'{ngs} Streak']), base - (2 * team[f'{ygs} Streak']))
+        return pd.Series(algo, index=team.index), available
+
+    algo_away_goalie, away_goalie_algo_available = goalie_algo(away_ng_goalie_percent, away_total_ng_goalie_percent, away_goalie, 'Away')
+    algo_home_goalie, home_goalie_algo_available = goalie_algo(home_ng_goalie_percent, home_total_ng_goalie_percent, home_goalie, 'Home')
+    algo_away_team, away_team_algo_available = team_algo(away_ngs_percent, away_intra_ngs_percent, away_team)
+    algo_home_team, home_team_algo_available = team_algo(home_ngs_percent, home_intra_ngs_percent, home_team)
+
+    # Clip the algo scores to 0-100 and scale them to 0-1; NaN scores stay NaN
+    algo_away_goalie = algo_away_goalie.clip(0, 100) / 100
+    algo_home_goalie = algo_home_goalie.clip(0, 100) / 100
+    algo_away_team = algo_away_team.clip(0, 100) / 100
+    algo_home_team = algo_home_team.clip(0, 100) / 100
+
+    home_algo_available = away_goalie_algo_available & home_team_algo_available & ~home_team_missing
+    away_algo_available = home_goalie_algo_available & away_team_algo_available & ~away_team_missing
+    home_algo_percentage = ((algo_home_team + algo_away_goalie) / 2) * 100
+    away_algo_percentage = ((algo_away_team + algo_home_goalie) / 2) * 100
+    algo_percentage = ((algo_home_team + algo_away_goalie) / 2) * ((algo_away_team + algo_home_goalie) / 2) * 100
+
+    # Build the rows; values of missing teams and goalies are shown as 'N/A'
+    updated_data = pd.DataFrame({
+        'Away Team': matchups_df['Away Team'],
+        'Away GS': whole_numbers(away_team['Away GS']),
+        'Away GS Color': calculate_color(away_team['Away GS'], team_min_max['Away GS'][0], team_min_max['Away GS'][1]),
+        f'Away {ng} %': whole_numbers(away_ng_percent),
+        f'Away {ng} % Color': calculate_ng_color(away_ng_percent),
+        f'Away {ngs} %': decimals(away_ngs_percent, away_team_missing),
+        f'Away {ngs} % Color': calculate_ngs_color(away_ngs_percent),
+        f'Away Total {ng} %': whole_numbers(away_total_ng_percent),
+        f'Away Total {ng} % Color': calculate_ng_color(away_total_ng_percent),
+        f'Away Total {ngs} %': whole_numbers(away_total_ngs_percent),
+        f'Away Total {ngs} % Color': calculate_ngs_color(away_total_ngs_percent),
+        f'Away Intra {ngs} %': decimals(away_intra_ngs_percent, away_team_missing),
+        f'Away Intra {ngs} % Color': calculate_ngs_color(away_intra_ngs_percent),
+
+        'Away L10': whole_numbers(away_team['L10 Streak']),
+        'Away Streak': whole_numbers(away_streak),
+        'Away Streak Color': calculate_streak_color(away_team[f'{ngs} Streak'], away_team_missing),
+
+        'Home Team': matchups_df['Home Team'],
+        'Home GS': whole_numbers(home_team['Home GS']),
+        'Home GS Color': calculate_color(home_team['Home GS'], team_min_max['Home GS'][0], team_min_max['Home GS'][1]),
+        f'Home {ng} %': whole_numbers(home_ng_percent),
+        f'Home {ng} % Color': calculate_ng_color(home_ng_percent),
+        f'Home {ngs} %': decimals(home_ngs_percent, home_team_missing),
+        f'Home {ngs} % Color': calculate_ngs_color(home_ngs_percent),
+        f'Home Total {ng} %': whole_numbers(home_total_ng_percent),
+        f'Home Total {ng} % Color': calculate_ng_color(home_total_ng_percent),
+        f'Home Total {ngs} %': whole_numbers(home_total_ngs_percent),
+        f'Home Total {ngs} % Color': calculate_ngs_color(home_total_ngs_percent),
+        f'Home Intra {ngs} %': decimals(home_intra_ngs_percent, home_team_missing),
+        f'Home Intra {ngs} % Color': calculate_ngs_color(home_intra_ngs_percent),
+
+        'Home L10': whole_numbers(home_team['L10 Streak']),
+        'Home Streak': whole_numbers(home_streak),
+        'Home Streak Color': calculate_streak_color(home_team[f'{ngs} Streak'], home_team_missing),
+
+        'Away Goalie': matchups_df['Away Goalie'],
+        f'Away {ng} (Goalie)': whole_numbers(away_goalie[f'Away {ng}']),
+        f'Away {ng} (Goalie) Color': calculate_color(away_goalie[f'Away {ng}'], goalie_min_max[f'Away {ng}'][0], goalie_min_max[f'Away {ng}'][1], inverse=True),
+        f'Away {yg} (Goalie)': whole_numbers(away_goalie[f'Away {yg}']),
+        f'Away {yg} (Goalie) Color': calculate_color(away_goalie[f'Away {yg}'], goalie_min_max[f'Away {yg}'][0], goalie_min_max[f'Away {yg}'][1]),
+        f'Away {ng} % (Goalie)': decimals(away_ng_goalie_percent, away_goalie_missing),
+        f'Away {ng} % (Goalie) Color': calculate_ng_color(away_ng_goalie_percent),
+        f'Away Total {ng} (Goalie)': whole_numbers(away_goalie[f'Total {ng}']),
+        f'Away Total {yg} (Goalie)': whole_numbers(away_goalie[f'Total {yg}']),
+        f'Away Total {ng} % (Goalie)': decimals(away_total_ng_goalie_percent, away_goalie_missing),
+        f'Away Total {ng} % (Goalie) Color': calculate_ng_color(away_total_ng_goalie_percent),
+        'Away L5 (Goalie)': whole_numbers(away_goalie['L5 Streak']),
+        'Away Streak (Goalie)': whole_numbers(away_goalie_streak),
+        'Away Streak (Goalie) Color': calculate_streak_color(away_goalie[f'{ng} Streak'], away_goalie_missing),
+
+        'Home Goalie': matchups_df['Home Goalie'],
+        f'Home {ng} (Goalie)': whole_numbers(home_goalie[f'Home {ng}']),
+        f'Home {ng} (Goalie) Color': calculate_color(home_goalie[f'Home {ng}'], goalie_min_max[f'Home {ng}'][0], goalie_min_max[f'Home {ng}'][1], inverse=True),
+        f'Home {yg} (Goalie)': whole_numbers(home_goalie[f'Home {yg}']),
+        f'Home {yg} (Goalie) Color': calculate_color(home_goalie[f'Home {yg}'], goalie_min_max[f'Home {yg}'][0], goalie_min_max[f'Home {yg}'][1]),
+        f'Home {ng} % (Goalie)': decimals(home_ng_goalie_percent, home_goalie_missing),
+        f'Home {ng} % (Goalie) Color': calculate_ng_color(home_ng_goalie_percent),
+        f'Home Total {ng} (Goalie)': whole_numbers(home_goalie[f'Total {ng}']),
+        f'Home Total {yg} (Goalie)': whole_numbers(home_goalie[f'Total {yg}']),
+        f'Home Total {ng} % (Goalie)': decimals(home_total_ng_goalie_percent, home_goalie_missing),
+        f'Home Total {ng} % (Goalie) Color': calculate_ng_color(home_total_ng_goalie_percent),
+        'Home L5 (Goalie)': whole_numbers(home_goalie['L5 Streak']),
+        'Home Streak (Goalie)': whole_numbers(home_goalie_streak),
+        'Home Streak (Goalie) Color': calculate_streak_color(home_goalie[f'{ng} Streak'], home_goalie_missing),
+
+        f'{ng} % (Goalies)': whole_numbers(ng_goalies_percent),
+        f'{ng} % (Goalies) Color': calculate_ng_color(ng_goalies_percent),
+
+        f'Away {ngs} Algo Percentage': rounded_decimals(away_algo_percentage, ~away_algo_available),
+        f'Home {ngs} Algo Percentage': rounded_decimals(home_algo_percentage, ~home_algo_available),
+        'Algo Percentage': rounded_decimals(algo_percentage, ~(away_algo_available & home_algo_available))
+    })
+
+    return updated_data.to_dict('records')
+
+
+# Computed matchup rows and rendered pages of each period, reused until one of its input CSVs changes
+matchups_cache = {period: {'version': None, 'data': None, 'pages': {}} for period in PERIODS}
+matchups_cache_locks = {period: threading.Lock() for period in PERIODS}
+
+def input_files_version(period):
+    filenames = (LINEUPS_FILE, PERIODS[period]['team_data'], PERIODS[period]['goalie_data'])
+    return tuple(file_version(filename) for filename in filenames)
+
+def get_matchups(period, matchups_df=None):
+    """
+    Return a period's cache entry for the current input CSVs, recomputing the matchup rows only when
+    the lineups, team data or goalie data file has changed since the last request.
+    matchups_df is passed on to compute_matchups.
+    """
+    version = input_files_version(period)
+    cache = matchups_cache[period]
+    with matchups_cache_locks[period]:
+        if cache['version'] != version:
+            cache['data'] = compute_matchups(period, matchups_df)
+            cache['pages'] = {}
+            cache['version'] = version
+            increment('matchups_cache', period=period, result='miss')
+        else:
+            increment('matchups_cache', period=period, result='hit')
+        return cache
+
+def render_matchups_page(period, matchups_df=None):
+    """Render a period's matchups page for today, reusing the last render while the inputs and date are unchanged."""
+    # Get the current date
+    current_date = datetime.date.today().strftime("%B %d, %Y")
+
+    cache = get_matchups(period, matchups_df)
+    with matchups_cache_locks[period]:
+        # The page shows today's date, so rendered pages are kept per date
+        page = cache['pages'].get(current_date)
+        if page is None:
+            page = render_template(TEMPLATES[period], data=cache['data'], date=current_date)
+            cache['pages'] = {current_date: page}
+
+    return page
@@ -0,0 +1,127 @@
+from flask import Flask, Response, abort, request
+import pandas as pd
+import datetime
+import hashlib
+import json
+import math
+import threading
+from nhl_matchups import LINEUPS_FILE, PERIODS, file_version, get_matchups, matchups_cache_locks, render_matchups_page
+from nhl_game_db import GAME_DB_FILENAME, games_for_goalie, games_for_team
+from nhl_metrics import increment, prometheus_text, timed
+
+app = Flask(__name__)
+
+
+# The app serves a page per period in PERIODS, each with its own matchups cache in nhl_matchups
+DEFAULT_PERIOD = 'fp'
+
+# Serve the stage timings and counters at /metrics in the Prometheus text format
+METRICS_ENDPOINT_ENABLED = True
+
+# Lineups table shared by every period, reloaded only when nhl_lineups.csv changes
+lineups_cache = {'version': None, 'data': None}
+lineups_cache_lock = threading.Lock()
+
+def load_lineups():
+    """Load the lineups CSV once for all periods, reusing the parsed table until the file changes."""
+    version = file_version(LINEUPS_FILE)
+    with lineups_cache_lock:
+        if lineups_cache['version'] != version:
+            lineups_cache['data'] = pd.read_csv(LINEUPS_FILE)
+            lineups_cache['version'] = version
+        return lineups_cache['data']
+
+def requested_period(period):
+    # The period comes from the path (/fp, /sp, /tp) or the query string (/?period=sp)
+    period = period or request.args.get('period', DEFAULT_PERIOD)
+    if period not in PERIODS:
+        abort(404)
+    return period
+
+@app.after_request
+def count_request(response):
+    increment('requests', endpoint=request.endpoint or 'none', status=response.status_code)
+    return response
+
+@app.route('/')
+@app.route('/<period>')
+@timed('request')
+def display_data(period=None):
+    period = requested_period(period)
+    return render_matchups_page(period, load_lineups())
+
+
+# Serialized API responses per period, reused while the period's input CSVs are unchanged
+api_cache = {period: {'version': None, 'body': None} for period in PERIODS}
+api_cache_lock = threading.Lock()
+
+def matchup_values(row):
+    """Drop the color columns of a matchup row, turning missing values (NaN or 'N/A') into None."""
+    return {
+        key: None if value == 'N/A' or (isinstance(value, float) and math.isnan(value)) else value
+        for key, value in row.items()
+        if not key.endswith('Color')
+    }
+
+def matchups_json(period):
+    """
+    Return (version, body) for a period: the input CSV versions the rows were computed from
+    and the rows serialized as compact JSON.
+    """
+    cache = get_matchups(period, load_lineups())
+    with matchups_cache_locks[period]:
+        version, data = cache['version'], cache['data']
+
+    with api_cache_lock:
+        entry = api_cache[period]
+        if entry['version'] != version:
+            rows = [matchup_values(row) for row in data]
+            entry['body'] = json.dumps({'period': period, 'matchups': rows}, separators=(',', ':'))
+            entry['version'] = version
+        return entry['version'], entry['body']
+
+@app.route('/api/matchups')
+@app.route('/api/matchups/<period>')
+@timed('request')
+def api_matchups(period=None):
+    period = requested_period(period)
+    version, body = matchups_json(period)
+
+    response = Response(body, mimetype='application/json')
+    # Both validators come from the input CSVs, so clients polling an unchanged table get a 304
+    response.set_etag(hashlib.sha1(repr((period, version)).encode('utf-8')).hexdigest())
+    last_modified_ns = max(mtime_ns for mtime_ns, _ in version)
+    response.last_modified = datetime.datetime.fromtimestamp(last_modified_ns / 1e9, tz=datetime.timezone.utc)
+    response.cache_control.no_cache = True
+    return response.make_conditional(request)
+
+@app.route('/api/games')
+@app.route('/api/games/<period>')
+@timed('request')
+def api_games(period=None):
+    """The period's games of a team (?team=) or goalie (?goalie=), looked up through the game database's indexes."""
+    period = requested_period(period)
+    gamelog_filename = PERIODS[period]['gamelog']
+    if 'team' in request.args:
+        games = games_for_team(request.args['team'], gamelog_filename, GAME_DB_FILENAME)
+    elif 'goalie' in request.args:
+        games = games_for_goalie(request.args['goalie'], gamelog_filename, GAME_DB_FILENAME)
+    else:
+        abort(400)
+
+    return Response(json.dumps({'period': period, 'games': games}, separators=(',', ':')), mimetype='application/json')
+
+@app.route('/metrics')
+def metrics():
+    """The stage timings and counters of this process, for a Prometheus scraper."""
+    if not METRICS_ENDPOINT_ENABLED:
+        abort(404)
+    return Response(prometheus_text(), mimetype='text/plain; version=0.0.4')
+
+def main(default_period=DEFAULT_PERIOD):
+    global DEFAULT_PERIOD
+    DEFAULT_PERIOD = default_period
+    app.run(debug=True)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,174 @@
+import json
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from nhl_files import atomic_write
+
+# Stages of the pipeline, in order: scraping (fetch to write), count_appearances (aggregate)
+# and the matchups apps (request). 'wait' is time spent blocked on the rate limit or on another
+# thread's goalie lookup, kept out of the stage that waited. Other stage names are added as they are first timed.
+STAGES = ['fetch', 'parse', 'extract', 'write', 'aggregate', 'request', 'wait']
+
+# Seconds spent in each stage and the number of times it ran, summed over every thread.
+# A stage's time excludes the stages nested in it, e.g. a box score's extraction excludes the pages it fetches and parses.
+stage_seconds = {stage: 0.0 for stage in STAGES}
+stage_calls = {stage: 0 for stage in STAGES}
+_stages_lock = threading.Lock()
+_local = threading.local()
+
+# Event counts, e.g. pages fetched per source, keyed by (name, sorted label pairs)
+counters = {}
+
+RUN_STARTED = time.time()
+
+# Suffix of the JSON run summaries written by the scripts' mains
+RUN_SUMMARY_SUFFIX = '_run_summary.json'
+
+# Prefix of the metric names in the Prometheus text format
+METRIC_PREFIX = 'nhl'
+
+
+@contextmanager
+def timed(stage):
+    """
+    Times the enclosed block under a stage, leaving out the time of stages timed inside it.
+
+    Parameters:
+    stage (str): The stage the block belongs to, e.g. 'fetch'.
+    """
+    stack = getattr(_local, 'stack', None)
+    if stack is None:
+        stack = _local.stack = []
+
+    # Each open block keeps the time its nested blocks took, to subtract from its own
+    stack.append(0.0)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        nested = stack.pop()
+        if stack:
+            stack[-1] += elapsed
+        with _stages_lock:
+            stage_seconds[stage] = stage_seconds.get(stage, 0.0) + elapsed - nested
+            stage_calls[stage] = stage_calls.get(stage, 0) + 1
+
+
+def increment(name, value=1, **labels):
+    """
+    Adds to a counter.
+
+    Parameters:
+    name (str): The counter, e.g. 'pages_fetched'.
+    value (int): The amount to add.
+    labels: Label values telling apart counts of the same counter, e.g. source='cache'.
+    """
+    key = (name, tuple(sorted(labels.items())))
+    with _stages_lock:
+        counters[key] = counters.get(key, 0) + value
+
+
+def reset_stages():
+    with _stages_lock:
+        for stage in list(stage_seconds):
+            stage_seconds[stage] = 0.0
+            stage_calls[stage] = 0
+        counters.clear()
+
+
+def stage_report():
+    """Returns a copy of the stage totals as {stage: {'seconds': ..., 'calls': ...}}."""
+    with _stages_lock:
+        return {stage: {'seconds': stage_seconds[stage], 'calls': stage_calls[stage]} for stage in stage_seconds}
+
+
+def counter_report():
+    """Returns the counters as a list of {'name': ..., 'labels': {...}, 'value': ...}, sorted by name."""
+    with _stages_lock:
+        return [
+            {'name': name, 'labels': dict(labels), 'value': value}
+            for (name, labels), value in sorted(counters.items())
+        ]
+
+
+def run_summary():
+    """The stage timings and counters of this run so far, with its start time and duration."""
+    now = time.time()
+    return {
+        'started_at': datetime.fromtimestamp(RUN_STARTED).isoformat(timespec='seconds'),
+        'finished_at': datetime.fromtimestamp(now).isoformat(timespec='seconds'),
+        'seconds': round(now - RUN_STARTED, 3),
+        'stages': stage_report(),
+        'counters': counter_report()
+    }
+
+
+# Function to save the run summary of a script as JSON
+def write_run_summary(name):
+    """
+    Writes run_summary() to {name}_run_summary.json, replacing the summary of the previous run.
+
+    Parameters:
+    name (str): The script the summary belongs to, e.g. 'nhl_fp_gamelog'.
+
+    Returns:
+    str: The summary filename.
+    """
+    filename = name + RUN_SUMMARY_SUFFIX
+    with atomic_write(filename) as tmp_filename, open(tmp_filename, mode='w', encoding='utf-8') as file:
+        json.dump(run_summary(), file, indent=2)
+    return filename
+
+
+def prometheus_labels(labels):
+    if not labels:
+        return ''
+    escaped = (
+        (key, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for key, value in labels.items()
+    )
+    return '{' + ','.join(f'{key}="{value}"' for key, value in escaped) + '}'
+
+
+def prometheus_text():
+    """
+    The stage timings and counters in the Prometheus text exposition format.
+
+    Returns:
+    str: One sample per line, each metric preceded by its TYPE line.
+    """
+    lines = [
+        f'# HELP {METRIC_PREFIX}_stage_seconds_total Seconds spent in each stage, excluding the stages nested in it.',
+        f'# TYPE {METRIC_PREFIX}_stage_seconds_total counter'
+    ]
+    report = stage_report()
+    for stage, stats in report.items():
+        lines.append(f'{METRIC_PREFIX}_stage_seconds_total{prometheus_labels({"stage": stage})} {stats["seconds"]:.6f}')
+    lines.append(f'# HELP {METRIC_PREFIX}_stage_calls_total Times each stage ran.')
+    lines.append(f'# TYPE {METRIC_PREFIX}_stage_calls_total counter')
+    for stage, stats in report.items():
+        lines.append(f'{METRIC_PREFIX}_stage_calls_total{prometheus_labels({"stage": stage})} {stats["calls"]}')
+
+    last_name = None
+    for counter in counter_report():
+        metric = f'{METRIC_PREFIX}_{counter["name"]}_total'
+        if counter['name'] != last_name:
+            lines.append(f'# TYPE {metric} counter')
+            last_name = counter['name']
+        lines.append(f'{metric}{prometheus_labels(counter["labels"])} {counter["value"]}')
+
+    return '\n'.join(lines) + '\n'
+
+
+def print_stage_report():
+    """Prints the time spent in each stage of this run."""
+    report = stage_report()
+    total = sum(stats['seconds'] for stats in report.values())
+    print("Stage timings:")
+    for stage, stats in report.items():
+        if not stats['calls']:
+            continue
+        share = round(stats['seconds'] / total * 100, 1) if total > 0 else 0
+        print(f"  {stage}: {stats['seconds']:.3f}s over {stats['calls']} calls ({share}%)")
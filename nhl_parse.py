@@ -0,0 +1,40 @@
+from bs4 import BeautifulSoup, SoupStrainer
+from nhl_metrics import timed
+
+# Prefer the C-backed lxml parser and fall back to Python's html.parser when it is not installed
+try:
+    import lxml  # noqa: F401
+    PARSER = 'lxml'
+except ImportError:
+    PARSER = 'html.parser'
+
+
+# Regions of each ESPN page the scrapers read; everything else is skipped while parsing.
+# Matches are kept in document order, so the linescore still comes before the player tables.
+SCOREBOARD_REGIONS = SoupStrainer('section', class_='Scoreboard bg-clr-white flex flex-auto justify-between')
+
+BOX_SCORE_REGIONS = SoupStrainer(['table', 'div'], class_=[
+    'Table Table--align-right',  # Linescore with the goals of each period
+    'Boxscore Boxscore__ResponsiveWrapper'  # Player tables with the goalies' GA and TOI
+])
+
+GOALIE_REGIONS = SoupStrainer(['div', 'aside'], class_=[
+    'PlayerHeader__Main_Aside min-w-0 flex-grow flex-basis-0',  # Goalie name
+    'StatBlock br-5 ba overflow-hidden flex-expand StatBlock--multiple bg-clr-white brdr-clr-gray-06 PlayerHeader__StatBlock'  # Season GAA
+])
+
+
+def make_soup(html, regions=None, parser=None):
+    """
+    Parses a page with the fastest available parser, optionally keeping only the given regions.
+
+    Parameters:
+    html (str): The page markup.
+    regions (SoupStrainer): The elements to keep, e.g. BOX_SCORE_REGIONS. None parses the whole page.
+    parser (str): The BeautifulSoup parser to use instead of PARSER.
+
+    Returns:
+    BeautifulSoup: The parsed document.
+    """
+    with timed('parse'):
+        return BeautifulSoup(html, parser or PARSER, parse_only=regions)
@@ -0,0 +1,65 @@
+import glob
+import json
+import os
+import timeit
+from bs4 import BeautifulSoup
+from nhl_http import CACHE_DIR
+from nhl_parse import PARSER, make_soup, BOX_SCORE_REGIONS, GOALIE_REGIONS, SCOREBOARD_REGIONS
+
+# Page types benchmarked, recognised by a fragment of the cached page's URL
+PAGE_TYPES = [
+    ('scoreboard', '/scoreboard/', SCOREBOARD_REGIONS),
+    ('boxscore', '/boxscore/', BOX_SCORE_REGIONS),
+    ('goalie', '/player/', GOALIE_REGIONS),
+]
+
+# Number of parses timed per page
+REPEAT = 5
+
+
+def load_cached_pages(cache_dir):
+    """
+    Groups the pages saved by the scrapers' HTTP cache by page type.
+
+    Parameters:
+    cache_dir (str): The HTTP cache directory.
+
+    Returns:
+    dict: Page type to the list of cached page bodies.
+    """
+    pages = {page_type: [] for page_type, _, _ in PAGE_TYPES}
+
+    for meta_filename in glob.glob(os.path.join(cache_dir, '*', '*.html.json')):
+        with open(meta_filename, mode='r', encoding='utf-8') as file:
+            url = json.load(file)['url']
+        for page_type, url_fragment, _ in PAGE_TYPES:
+            if url_fragment in url:
+                with open(meta_filename[:-len('.json')], mode='r', encoding='utf-8') as file:
+                    pages[page_type].append(file.read())
+                break
+
+    return pages
+
+
+def time_per_page(pages, parse):
+    total = sum(timeit.timeit(lambda: parse(html), number=REPEAT) for html in pages)
+    return total / (len(pages) * REPEAT) * 1000
+
+
+def main():
+    pages = load_cached_pages(CACHE_DIR)
+
+    print(f"Parse time per page: full page with html.parser vs. targeted regions with {PARSER}")
+    print(f"{'Page type':<12}{'Pages':>7}{'Before (ms)':>14}{'After (ms)':>13}{'Speedup':>10}")
+
+    for page_type, _, regions in PAGE_TYPES:
+        if not pages[page_type]:
+            print(f"{page_type:<12}{0:>7}  no cached pages, run a scraper first")
+            continue
+
+        before = time_per_page(pages[page_type], lambda html: BeautifulSoup(html, 'html.parser'))
+        after = time_per_page(pages[page_type], lambda html: make_soup(html, regions))
+        print(f"{page_type:<12}{len(pages[page_type]):>7}{before:>14.2f}{after:>13.2f}{before / after:>9.1f}x")
+
+if __name__ == '__main__':
+    main()
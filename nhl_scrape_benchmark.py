@@ -0,0 +1,90 @@
+import contextlib
+import io
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+import nhl_game_db
+import nhl_goalie_cache
+import nhl_http
+from nhl_fp_gamelog import MAX_WORKERS, iter_games
+from nhl_gamelog_store import backfill
+from nhl_metrics import reset_stages, stage_report
+
+# Season scraped by the benchmark: the 2024-25 regular season
+SEASON_START = '2024-10-04'
+SEASON_END = '2025-04-17'
+
+
+def run_season(directory, max_workers):
+    """
+    Scrapes the season into a fresh first-period gamelog in directory, with its own game database
+    and goalie cache, so every run does the same work.
+
+    Parameters:
+    directory (str): Where the gamelog, database and goalie cache are written.
+    max_workers (int): Box scores fetched at once per date.
+
+    Returns:
+    tuple: (rows written, seconds taken)
+    """
+    gamelog_filename = os.path.join(directory, 'nhl_fp_gamelog.csv')
+    game_db_filename, goalie_cache = nhl_game_db.GAME_DB_FILENAME, nhl_goalie_cache.goalie_cache
+    nhl_game_db.GAME_DB_FILENAME = os.path.join(directory, os.path.basename(game_db_filename))
+    nhl_goalie_cache.goalie_cache = nhl_goalie_cache.GoalieCache(os.path.join(directory, os.path.basename(goalie_cache.filename)))
+
+    start = time.perf_counter()
+    try:
+        # The scraper's debugging prints are kept out of the report
+        with contextlib.redirect_stdout(io.StringIO()):
+            rows_written = backfill(
+                datetime.strptime(SEASON_START, '%Y-%m-%d'), datetime.strptime(SEASON_END, '%Y-%m-%d'),
+                lambda date_str: ((gamelog_filename, row) for row in iter_games(date_str, max_workers)),
+                [gamelog_filename], os.path.join(directory, 'benchmark.progress.json')
+            )
+    finally:
+        nhl_game_db.GAME_DB_FILENAME, nhl_goalie_cache.goalie_cache = game_db_filename, goalie_cache
+    return rows_written[gamelog_filename], time.perf_counter() - start
+
+
+# Function to record the season's pages as fixtures over the network
+def record():
+    nhl_http.configure_fixtures('record')
+    with tempfile.TemporaryDirectory() as directory:
+        rows, seconds = run_season(directory, MAX_WORKERS)
+    print(f"Recorded the pages of {rows} games in {seconds:.1f}s to {nhl_http.FIXTURES_DIR}")
+
+
+# Function to replay the recorded season serially and report where the time goes
+def replay():
+    """
+    Replays the recorded season through the first-period scraper, one box score at a time so the
+    stage timings add up to the run time, and prints the time spent fetching (reading fixtures),
+    parsing, extracting and writing.
+    """
+    if not os.path.isdir(nhl_http.FIXTURES_DIR):
+        print(f"No fixtures in {nhl_http.FIXTURES_DIR}, run 'python nhl_scrape_benchmark.py record' first")
+        return
+
+    nhl_http.configure_fixtures('replay')
+    reset_stages()
+    with tempfile.TemporaryDirectory() as directory:
+        rows, seconds = run_season(directory, 1)
+
+    print(f"Replayed {SEASON_START} to {SEASON_END}: {rows} games in {seconds:.2f}s ({rows / seconds:.1f} games/s)")
+    print(f"{'Stage':<10}{'Calls':>8}{'Time (s)':>11}{'Per call (ms)':>16}{'Share':>8}")
+    for stage, stats in stage_report().items():
+        if not stats['calls']:
+            continue
+        per_call = stats['seconds'] / stats['calls'] * 1000 if stats['calls'] else 0
+        print(f"{stage:<10}{stats['calls']:>8}{stats['seconds']:>11.3f}{per_call:>16.3f}{stats['seconds'] / seconds * 100:>7.1f}%")
+
+def main():
+    if len(sys.argv) > 1 and sys.argv[1] == 'record':
+        record()
+    else:
+        replay()
+
+if __name__ == '__main__':
+    main()
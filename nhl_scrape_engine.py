@@ -0,0 +1,81 @@
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Dates scraped at once by the engine. Every date fans out to its own box score and goalie pages,
+# so keep CONCURRENT_DATES * MAX_WORKERS near nhl_http.POOL_SIZE; nhl_http.RATE_LIMIT caps the request rate of all of them.
+CONCURRENT_DATES = 2
+
+# Markers a date's worker puts after its rows
+DATE_DONE = object()
+DATE_FAILED = object()
+
+
+def scrape_date_rows(date_str, scrape_date, rows, stop):
+    # Runs in a worker thread, handing each row over as soon as it is scraped
+    try:
+        for row in scrape_date(date_str):
+            if stop.is_set():
+                return
+            rows.put((row, None))
+    except BaseException as e:
+        rows.put((DATE_FAILED, e))
+    else:
+        rows.put((DATE_DONE, None))
+
+
+def stream_rows(rows):
+    """Yields a date's rows while its worker is still scraping the rest, raising whatever the worker raised."""
+    while True:
+        row, error = rows.get()
+        if row is DATE_DONE:
+            return
+        if row is DATE_FAILED:
+            raise error
+        yield row
+
+
+# Function to scrape several dates at once while handing their rows back in date order
+def scrape_dates(dates, scrape_date, concurrent_dates=CONCURRENT_DATES):
+    """
+    Scrapes dates concurrently in worker threads and yields each date's rows in date order,
+    so callers can keep writing and checkpointing one date at a time.
+
+    The rows of the date being yielded are streamed as they are scraped. Dates after it are scraped
+    in the meantime and their rows are queued until the caller reaches them.
+
+    Parameters:
+    dates (list): YYYYMMDD date strings, in the order their rows are yielded.
+    scrape_date (callable): Takes a date string and returns an iterable of rows.
+    concurrent_dates (int): The maximum number of dates in flight at once. 1 scrapes lazily, one date at a time.
+
+    Yields:
+    tuple: (date_str, rows), where rows is an iterator over the date's rows.
+    """
+    if concurrent_dates <= 1:
+        for date_str in dates:
+            yield date_str, scrape_date(date_str)
+        return
+
+    stop = threading.Event()
+    pending = []
+    executor = ThreadPoolExecutor(max_workers=concurrent_dates)
+
+    def start(index):
+        if index < len(dates):
+            rows = queue.Queue()
+            executor.submit(scrape_date_rows, dates[index], scrape_date, rows, stop)
+            pending.append((dates[index], rows))
+
+    try:
+        for index in range(concurrent_dates):
+            start(index)
+        for index in range(len(dates)):
+            date_str, rows = pending.pop(0)
+            yield date_str, stream_rows(rows)
+            # The next date starts once the caller moves past this one, keeping concurrent_dates in flight
+            start(index + concurrent_dates)
+    finally:
+        # Dates still running stop at their next row when the caller stops early
+        stop.set()
+        executor.shutdown(wait=True)
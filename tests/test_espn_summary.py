@@ -0,0 +1,100 @@
+"""
+Replays the recorded pages of one date through the game summary JSON and through the box score page
+fallback, and checks that both sources produce the same gamelog rows.
+
+The fixtures in fixtures/espn hold the scoreboard, box score pages, game summaries and goalie pages of
+20241008, laid out like ESPN's and recorded through nhl_http.configure_fixtures('record'). Goalie pages
+are only recorded under their canonical PLAYER_URL, so a path requesting any other URL fails.
+"""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import nhl_espn_summary
+import nhl_fp_gamelog
+import nhl_gamelog
+import nhl_goalie_cache
+import nhl_http
+import nhl_metrics
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'espn')
+DATE = '20241008'
+
+# Nothing is recorded under this URL, so every summary fetch fails and the box score page is scraped instead
+UNRECORDED_SUMMARY_URL = 'https://site.api.espn.com/apis/site/v2/sports/hockey/nhl/unrecorded?event={game_id}'
+
+
+def box_score_sources():
+    """The box_scores counter of this run, by source."""
+    return {counter['labels']['source']: counter['value']
+            for counter in nhl_metrics.counter_report() if counter['name'] == 'box_scores'}
+
+
+class SummaryFallbackTest(unittest.TestCase):
+
+    def setUp(self):
+        self.settings = (nhl_http.FIXTURES_MODE, nhl_http.FIXTURES_DIR, nhl_espn_summary.SUMMARY_ENABLED,
+                         nhl_espn_summary.SUMMARY_URL, nhl_goalie_cache.GOALIE_CACHE_ENABLED)
+        nhl_http.configure_fixtures('replay', FIXTURES_DIR)
+        nhl_espn_summary.SUMMARY_ENABLED = True
+        # Every goalie page is read from the fixtures rather than from a cache left by an earlier scrape
+        nhl_goalie_cache.GOALIE_CACHE_ENABLED = False
+        nhl_metrics.reset_stages()
+
+    def tearDown(self):
+        (fixtures_mode, fixtures_dir, nhl_espn_summary.SUMMARY_ENABLED,
+         nhl_espn_summary.SUMMARY_URL, nhl_goalie_cache.GOALIE_CACHE_ENABLED) = self.settings
+        nhl_http.configure_fixtures(fixtures_mode, fixtures_dir)
+        nhl_metrics.reset_stages()
+
+    def replay(self, iter_games, summary_url):
+        nhl_espn_summary.SUMMARY_URL = summary_url
+        nhl_metrics.reset_stages()
+        rows = list(iter_games(DATE, max_workers=1))
+        return rows, box_score_sources()
+
+    def assert_same_rows(self, iter_games):
+        json_rows, json_sources = self.replay(iter_games, nhl_espn_summary.SUMMARY_URL)
+        html_rows, html_sources = self.replay(iter_games, UNRECORDED_SUMMARY_URL)
+
+        self.assertEqual(json_sources, {'summary': 3})
+        self.assertEqual(html_sources, {'html': 3})
+        self.assertEqual(json_rows, html_rows)
+        return json_rows
+
+    def test_period_gamelog_rows_match(self):
+        rows = self.assert_same_rows(nhl_fp_gamelog.iter_games)
+
+        self.assertEqual([(row['Away Team'], row['Home Team']) for row in rows],
+                         [('Blues', 'Kraken'), ('Bruins', 'Panthers'), ('Blackhawks', 'Utah Hockey Club')])
+        self.assertEqual(rows[1], {
+            'Date': DATE, 'Away Team': 'Bruins', 'Home Team': 'Panthers',
+            'Away Team Goals': '1', 'Home Team Goals': '4',
+            'Away Goalie': 'Joonas Korpisalo', 'Home Goalie': 'Sergei Bobrovsky',
+            'Away Goalie TOI': 20, 'Home Goalie TOI': 20, 'Away Goalie GA': '4', 'Home Goalie GA': '1',
+            'Away GAA': '6.19', 'Home GAA': '3.04'
+        })
+
+    def test_all_periods_gamelog_rows_match(self):
+        rows = self.assert_same_rows(nhl_gamelog.iter_games_all_periods)
+
+        self.assertEqual(len(rows), 9)
+        self.assertEqual([(period, row['Away Team Goals'], row['Home Team Goals']) for period, row in rows[:3]],
+                         [('fp', '0', '0'), ('sp', '3', '2'), ('tp', '0', '0')])
+
+
+class PlayerUrlTest(unittest.TestCase):
+
+    def test_links_resolve_to_the_canonical_url(self):
+        canonical = nhl_espn_summary.PLAYER_URL.format(player_id='3135')
+        for url in ('https://www.espn.com/nhl/player/_/id/3135/joonas-korpisalo',
+                    'https://www.espn.com/nhl/player/_/id/3135',
+                    'https://www.espn.com/nhl/player/stats/_/id/3135/joonas-korpisalo?season=2025'):
+            self.assertEqual(nhl_espn_summary.player_url(url), canonical)
+        self.assertEqual(nhl_espn_summary.goalie_url({'id': '3135', 'links': []}), canonical)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+"""
+Checks that game database reads match the gamelog CSV: the CSV is read while the database is disabled
+or out of sync with it, and the database only while it holds what the CSV holds.
+"""
+import csv
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import nhl_game_db
+import nhl_metrics
+from nhl_gamelog_store import GAMELOG_FIELDNAMES, append_new_games, read_scraped_games
+
+
+def game_row(date_str, away_team, home_team, away_gaa='2.00'):
+    return {
+        'Date': date_str, 'Away Team': away_team, 'Home Team': home_team,
+        'Away Team Goals': '0', 'Home Team Goals': '1', 'Away Goalie': 'A', 'Home Goalie': 'B',
+        'Away Goalie TOI': '20', 'Home Goalie TOI': '20', 'Away Goalie GA': '1', 'Home Goalie GA': '0',
+        'Away GAA': away_gaa, 'Home GAA': '3.00'
+    }
+
+
+def game_db_reads():
+    """The game_db_reads counter of this run, by source."""
+    return {counter['labels']['source']: counter['value']
+            for counter in nhl_metrics.counter_report() if counter['name'] == 'game_db_reads'}
+
+
+class GameDbTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.gamelog_filename = os.path.join(self.directory.name, 'nhl_fp_gamelog.csv')
+        self.db_filename = os.path.join(self.directory.name, 'nhl_games.sqlite3')
+        with open(self.gamelog_filename, mode='w', newline='', encoding='utf-8') as file:
+            writer = csv.DictWriter(file, fieldnames=GAMELOG_FIELDNAMES)
+            writer.writeheader()
+            writer.writerow(game_row('20241008', 'Blues', 'Kraken'))
+            # ESPN shows '--' for a goalie without a GAA yet
+            writer.writerow(game_row('20241008', 'Bruins', 'Panthers', away_gaa='--'))
+        self.game_db_enabled = nhl_game_db.GAME_DB_ENABLED
+        nhl_metrics.reset_stages()
+
+    def tearDown(self):
+        nhl_game_db.GAME_DB_ENABLED = self.game_db_enabled
+        nhl_metrics.reset_stages()
+        self.directory.cleanup()
+
+    def games_for_team(self, team):
+        return nhl_game_db.games_for_team(team, self.gamelog_filename, self.db_filename)
+
+    def test_disabled_database_is_not_created(self):
+        nhl_game_db.GAME_DB_ENABLED = False
+
+        self.assertEqual(self.games_for_team('Bruins'), [game_row('20241008', 'Bruins', 'Panthers', away_gaa='--')])
+        self.assertFalse(os.path.exists(self.db_filename))
+        self.assertEqual(game_db_reads(), {'csv': 1})
+
+    def test_reads_follow_the_csv(self):
+        nhl_game_db.GAME_DB_ENABLED = True
+        nhl_game_db.import_gamelog(self.gamelog_filename, self.db_filename)
+
+        # Text stored in a numeric column reads back as the CSV holds it
+        self.assertEqual(self.games_for_team('Bruins'), [game_row('20241008', 'Bruins', 'Panthers', away_gaa='--')])
+        self.assertEqual(game_db_reads(), {'db': 1})
+
+        # Games appended through the database keep it in sync
+        _, scraped_games = read_scraped_games(self.gamelog_filename)
+        self.append(scraped_games, game_row('20241009', 'Kraken', 'Bruins'), through_db=True)
+        self.assertEqual(len(self.games_for_team('Bruins')), 2)
+        self.assertEqual(game_db_reads(), {'db': 2})
+
+        # A game appended to the CSV alone puts the database out of sync, and later writes through it keep it so
+        self.append(scraped_games, game_row('20241010', 'Bruins', 'Blues'), through_db=False)
+        self.append(scraped_games, game_row('20241011', 'Sabres', 'Bruins'), through_db=True)
+        self.assertEqual(self.games_for_team('Bruins'), self.csv_games_for_team('Bruins'))
+        self.assertEqual(game_db_reads(), {'db': 2, 'csv': 1})
+
+        nhl_game_db.import_gamelog(self.gamelog_filename, self.db_filename)
+        self.assertEqual(self.games_for_team('Bruins'), self.csv_games_for_team('Bruins'))
+        self.assertEqual(game_db_reads(), {'db': 3, 'csv': 1})
+
+    def append(self, scraped_games, row, through_db):
+        connection = nhl_game_db.connect(self.db_filename) if through_db else None
+        try:
+            append_new_games(self.gamelog_filename, [row], scraped_games, connection)
+        finally:
+            if connection:
+                connection.close()
+
+    def csv_games_for_team(self, team):
+        with open(self.gamelog_filename, mode='r', newline='', encoding='utf-8') as file:
+            return [row for row in csv.DictReader(file) if team in (row['Away Team'], row['Home Team'])]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,160 @@
+"""
+Runs backfills and incremental updates over a scripted date scraper and checks that a date whose scrape
+fails is left out of the gamelog and retried by the next run, with the gamelog left in date order.
+"""
+import csv
+import json
+import os
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from unittest import mock
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import nhl_game_db
+import nhl_gamelog
+import nhl_http
+from nhl_gamelog_store import GAMELOG_FIELDNAMES, backfill, progress_filename
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures', 'espn')
+DATES = ['20241008', '20241009', '20241010']
+
+
+def read_dates(filename):
+    with open(filename, mode='r', newline='', encoding='utf-8') as file:
+        return [row['Date'] for row in csv.DictReader(file)]
+
+
+def game_row(date_str, away_team, home_team):
+    return {
+        'Date': date_str, 'Away Team': away_team, 'Home Team': home_team,
+        'Away Team Goals': '0', 'Home Team Goals': '1', 'Away Goalie': 'A', 'Home Goalie': 'B',
+        'Away Goalie TOI': '20', 'Home Goalie TOI': '20', 'Away Goalie GA': '1', 'Home Goalie GA': '0',
+        'Away GAA': '2.00', 'Home GAA': '3.00'
+    }
+
+
+class BackfillFailureTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.gamelog_filename = os.path.join(self.directory.name, 'nhl_fp_gamelog.csv')
+        self.checkpoint_filename = progress_filename(self.gamelog_filename)
+        self.game_db_settings = nhl_game_db.GAME_DB_ENABLED, nhl_game_db.GAME_DB_FILENAME
+        nhl_game_db.GAME_DB_ENABLED = False
+        nhl_game_db.GAME_DB_FILENAME = os.path.join(self.directory.name, 'nhl_games.sqlite3')
+
+    def tearDown(self):
+        nhl_game_db.GAME_DB_ENABLED, nhl_game_db.GAME_DB_FILENAME = self.game_db_settings
+        self.directory.cleanup()
+
+    def run_backfill(self, failing_date, concurrent_dates):
+        def scrape_date(date_str):
+            yield self.gamelog_filename, game_row(date_str, 'Blues', 'Kraken')
+            if date_str == failing_date:
+                raise requests.ConnectionError(f"No scoreboard for {date_str}")
+            yield self.gamelog_filename, game_row(date_str, 'Bruins', 'Panthers')
+
+        return backfill(
+            datetime.strptime(DATES[0], '%Y%m%d'), datetime.strptime(DATES[-1], '%Y%m%d'), scrape_date,
+            [self.gamelog_filename], self.checkpoint_filename, concurrent_dates=concurrent_dates
+        )
+
+    def assert_failed_date_is_retried(self, concurrent_dates):
+        with self.assertRaises(requests.ConnectionError):
+            self.run_backfill(DATES[1], concurrent_dates)
+
+        # The failed date's first row is gone and the date is left for the next run
+        self.assertEqual(read_dates(self.gamelog_filename), [DATES[0], DATES[0]])
+        with open(self.checkpoint_filename, mode='r', encoding='utf-8') as file:
+            self.assertEqual(json.load(file)['completed_dates'], [DATES[0]])
+
+        rows_written = self.run_backfill(None, concurrent_dates)
+
+        self.assertEqual(rows_written, {self.gamelog_filename: 6})
+        self.assertEqual(read_dates(self.gamelog_filename), [date_str for date_str in DATES for _ in range(2)])
+        self.assertFalse(os.path.exists(self.checkpoint_filename))
+
+    def test_failed_date_is_retried(self):
+        self.assert_failed_date_is_retried(concurrent_dates=1)
+
+    def test_failed_date_is_retried_when_dates_are_scraped_concurrently(self):
+        self.assert_failed_date_is_retried(concurrent_dates=2)
+
+    def test_game_database_follows_the_retried_backfill(self):
+        nhl_game_db.GAME_DB_ENABLED = True
+        self.assert_failed_date_is_retried(concurrent_dates=2)
+
+        connection = nhl_game_db.connect(nhl_game_db.GAME_DB_FILENAME)
+        try:
+            self.assertTrue(nhl_game_db.is_synced(connection, self.gamelog_filename))
+        finally:
+            connection.close()
+        with open(self.gamelog_filename, mode='r', newline='', encoding='utf-8') as file:
+            self.assertEqual(nhl_game_db.read_game_rows(nhl_game_db.GAME_DB_FILENAME, self.gamelog_filename),
+                             list(csv.DictReader(file)))
+
+
+class UpdateFailureTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.gamelog_filename = os.path.join(self.directory.name, 'nhl_fp_gamelog.csv')
+        with open(self.gamelog_filename, mode='w', newline='', encoding='utf-8') as file:
+            writer = csv.DictWriter(file, fieldnames=GAMELOG_FIELDNAMES)
+            writer.writeheader()
+            writer.writerow(game_row(DATES[0], 'Blues', 'Kraken'))
+        self.game_db_enabled = nhl_game_db.GAME_DB_ENABLED
+        nhl_game_db.GAME_DB_ENABLED = False
+
+    def tearDown(self):
+        nhl_game_db.GAME_DB_ENABLED = self.game_db_enabled
+        self.directory.cleanup()
+
+    def update(self, failing_date, concurrent_dates):
+        def iter_games(periods, date_str, max_workers=nhl_gamelog.MAX_WORKERS):
+            yield 'fp', game_row(date_str, 'Blues', 'Kraken')
+            if date_str == failing_date:
+                raise requests.ConnectionError(f"No box score for {date_str}")
+            yield 'fp', game_row(date_str, 'Bruins', 'Panthers')
+
+        with mock.patch.object(nhl_gamelog, 'iter_games', iter_games):
+            return nhl_gamelog.update_csv_incremental('fp', self.gamelog_filename, DATES[-1], concurrent_dates)
+
+    def assert_failed_date_is_retried(self, concurrent_dates):
+        with self.assertRaises(requests.ConnectionError):
+            self.update(DATES[1], concurrent_dates)
+
+        # The last Date is still the one before the failed date, so the next update starts over from it
+        self.assertEqual(read_dates(self.gamelog_filename), [DATES[0], DATES[0]])
+
+        self.assertEqual(self.update(None, concurrent_dates), 4)
+        self.assertEqual(read_dates(self.gamelog_filename), [date_str for date_str in DATES for _ in range(2)])
+
+    def test_failed_date_is_retried(self):
+        self.assert_failed_date_is_retried(concurrent_dates=1)
+
+    def test_failed_date_is_retried_when_dates_are_scraped_concurrently(self):
+        self.assert_failed_date_is_retried(concurrent_dates=2)
+
+
+    def test_unrecorded_scoreboard_fails_the_update(self):
+        # The fixtures hold 20241008 but not the scoreboard of the day after
+        fixtures_mode, fixtures_dir = nhl_http.FIXTURES_MODE, nhl_http.FIXTURES_DIR
+        nhl_http.configure_fixtures('replay', FIXTURES_DIR)
+        try:
+            with self.assertRaises(requests.ConnectionError):
+                nhl_gamelog.update_csv_incremental('fp', self.gamelog_filename, '20241009', concurrent_dates=1)
+        finally:
+            nhl_http.configure_fixtures(fixtures_mode, fixtures_dir)
+
+        # 20241008 is scraped again and its other two games are added, but nothing past it
+        self.assertEqual(read_dates(self.gamelog_filename), [DATES[0]] * 3)
+
+
+if __name__ == '__main__':
+    unittest.main()